@@ -0,0 +1,122 @@
+# frames.py (re-express UVoxIDs relative to Earth, Moon or Sun)
+
+import math
+from datetime import datetime
+from functools import lru_cache
+from uvoxid.core import encode_uvoxid, decode_uvoxid
+from extras.ephemeris import sun_barycenter_uvoxid, moon_barycenter_uvoxid
+
+# All frames share the same axes as the Earth-centred ephemeris frame
+# (lat/lon measured against the same reference), so a frame change is a
+# pure translation between body centres.
+BODIES = ("earth", "moon", "sun")
+
+_BODY_POSITION = {
+    "moon": moon_barycenter_uvoxid,
+    "sun": sun_barycenter_uvoxid,
+}
+
+
+# --- Spherical <-> Cartesian (µm) ---
+def uvoxid_to_xyz(uvoxid: int) -> tuple[float, float, float]:
+    r_um, lat_microdeg, lon_microdeg = decode_uvoxid(uvoxid)
+    lat, lon = math.radians(lat_microdeg / 1e6), math.radians(lon_microdeg / 1e6)
+    cos_lat = math.cos(lat)
+    return r_um * cos_lat * math.cos(lon), r_um * cos_lat * math.sin(lon), r_um * math.sin(lat)
+
+def xyz_to_uvoxid(x: float, y: float, z: float) -> int:
+    r = math.sqrt(x*x + y*y + z*z)
+    if r == 0:
+        return encode_uvoxid(0, 0, 0)
+    lat = round(math.degrees(math.asin(max(-1.0, min(1.0, z / r)))) * 1e6)
+    lon = round(math.degrees(math.atan2(y, x)) * 1e6)
+    if lon >= 180_000_000:
+        lon -= 360_000_000
+    return encode_uvoxid(round(r), lat, lon)
+
+
+# --- Cached per-timestamp offsets ---
+def _check_body(body: str) -> str:
+    body = body.lower()
+    if body not in BODIES:
+        raise ValueError(f"unknown body {body!r}, expected one of {BODIES}")
+    return body
+
+@lru_cache(maxsize=1024)
+def body_position_um(body: str, when: datetime) -> tuple[float, float, float]:
+    """Cartesian position (µm) of a body's centre in the Earth-centred frame."""
+    body = _check_body(body)
+    if body == "earth":
+        return 0.0, 0.0, 0.0
+    return uvoxid_to_xyz(_BODY_POSITION[body](when))
+
+@lru_cache(maxsize=1024)
+def frame_translation_um(src: str, dst: str, when: datetime) -> tuple[float, float, float]:
+    """
+    Translation (µm) that maps a position in the `src` frame to the `dst`
+    frame at `when`: p_dst = p_src + t.
+    """
+    sx, sy, sz = body_position_um(src, when)
+    dx, dy, dz = body_position_um(dst, when)
+    return sx - dx, sy - dy, sz - dz
+
+
+# --- Batch transforms ---
+def transform_uvoxids(uvoxids, src: str, dst: str, when: datetime) -> list[int]:
+    """
+    Re-encode UVoxIDs given in the `src` body frame into the `dst` body frame.
+
+    Args:
+        uvoxids: iterable of UVoxID integers in the `src` frame.
+        src, dst: "earth", "moon" or "sun".
+        when: timestamp (timezone-aware datetime) for the ephemeris.
+
+    Returns:
+        list[int]: UVoxIDs centred on `dst`.
+    """
+    tx, ty, tz = frame_translation_um(_check_body(src), _check_body(dst), when)
+    to_xyz, to_uv = uvoxid_to_xyz, xyz_to_uvoxid
+    out = []
+    append = out.append
+    for uv in uvoxids:
+        x, y, z = to_xyz(uv)
+        append(to_uv(x + tx, y + ty, z + tz))
+    return out
+
+def transform_uvoxid(uvoxid: int, src: str, dst: str, when: datetime) -> int:
+    return transform_uvoxids((uvoxid,), src, dst, when)[0]
+
+def roundtrip_error_um(uvoxids, src: str, dst: str, when: datetime) -> dict:
+    """
+    Transform src → dst → src and measure how far each voxel moved.
+
+    Integer re-encoding at large radii (e.g. 1 AU from the Sun) rounds the
+    angular fields, so this reports the achieved precision in µm.
+
+    Returns:
+        dict with:
+          - max_um: worst-case displacement
+          - mean_um: mean displacement
+          - count: number of voxels checked
+    """
+    uvoxids = list(uvoxids)
+    back = transform_uvoxids(transform_uvoxids(uvoxids, src, dst, when), dst, src, when)
+    errors = [math.dist(uvoxid_to_xyz(a), uvoxid_to_xyz(b)) for a, b in zip(uvoxids, back)]
+    return {
+        "max_um": max(errors, default=0.0),
+        "mean_um": sum(errors) / len(errors) if errors else 0.0,
+        "count": len(errors),
+    }
+
+# --- Example ---
+if __name__ == "__main__":
+    from datetime import timezone
+
+    now = datetime.now(timezone.utc)
+    EARTH_RADIUS_UM = 6_371_000_000_000
+    voxels = [encode_uvoxid(EARTH_RADIUS_UM, lat * 1_000_000, 0) for lat in range(-80, 81, 20)]
+
+    in_sun = transform_uvoxids(voxels, "earth", "sun", now)
+    r_um, lat, lon = decode_uvoxid(in_sun[0])
+    print(f"First voxel in Sun frame → r={r_um:,} µm, lat={lat/1e6:.6f}°, lon={lon/1e6:.6f}°")
+    print("Round-trip error:", roundtrip_error_um(voxels, "earth", "sun", now))
@@ -0,0 +1,306 @@
+"""
+compression.py — block-based delta/varint encoding for sorted UVoxID sequences.
+
+Raw `uvoxid_to_bin` spends 24 bytes per ID, but sorted voxel sets and slow
+trajectories differ very little from one ID to the next. This format stores
+each of the three 64-bit fields (r, lat, lon) as a zigzag varint delta against
+the previous ID.
+
+Layout:
+  stream  := block*
+  block   := varint(block_len) body
+  body    := varint(count) varint(restart_interval) restart_offset* payload
+  payload := entry*
+
+Every `restart_interval`-th entry is a restart point: its fields are stored
+as plain varints instead of deltas, and its payload offset is recorded as a
+4-byte big-endian integer. Random access within a block therefore decodes at
+most `restart_interval` entries.
+"""
+
+import io
+from typing import BinaryIO, Iterable, Iterator, Union
+
+MASK64 = (1 << 64) - 1
+RAW_RECORD_BYTES = 24
+OFFSET_BYTES = 4
+
+DEFAULT_BLOCK_SIZE = 1024
+DEFAULT_RESTART_INTERVAL = 16
+
+
+# --- Varint primitives ---
+def zigzag_encode(n: int) -> int:
+    """Map a signed int to an unsigned one (0, -1, 1, -2, ... → 0, 1, 2, 3, ...)."""
+    return (n << 1) if n >= 0 else ((-n) << 1) - 1
+
+
+def zigzag_decode(z: int) -> int:
+    """Inverse of `zigzag_encode`."""
+    return (z >> 1) if not z & 1 else -((z + 1) >> 1)
+
+
+def _write_varint(out: bytearray, n: int) -> None:
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(buf, pos: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _split(uvoxid: int) -> tuple[int, int, int]:
+    """Split a UVoxID into its raw (unsigned) r, lat, lon fields."""
+    return (uvoxid >> 128) & MASK64, (uvoxid >> 64) & MASK64, uvoxid & MASK64
+
+
+# --- Block encode/decode ---
+def encode_block(uvoxids: Iterable[int],
+                 restart_interval: int = DEFAULT_RESTART_INTERVAL) -> bytes:
+    """
+    Encode one block of UVoxIDs (length-prefixed, ready to concatenate).
+
+    Args:
+        uvoxids: UVoxID integers, ideally sorted so that deltas stay small.
+        restart_interval (int): store a full entry every N entries.
+
+    Returns:
+        bytes: the encoded block.
+    """
+    if restart_interval < 1:
+        raise ValueError("restart_interval must be >= 1")
+
+    payload = bytearray()
+    restarts = []
+    count = 0
+    prev_r = prev_lat = prev_lon = 0
+
+    for uv in uvoxids:
+        r, lat, lon = _split(uv)
+        if count % restart_interval == 0:
+            restarts.append(len(payload))
+            _write_varint(payload, r)
+            _write_varint(payload, lat)
+            _write_varint(payload, lon)
+        else:
+            _write_varint(payload, zigzag_encode(r - prev_r))
+            _write_varint(payload, zigzag_encode(lat - prev_lat))
+            _write_varint(payload, zigzag_encode(lon - prev_lon))
+        prev_r, prev_lat, prev_lon = r, lat, lon
+        count += 1
+
+    body = bytearray()
+    _write_varint(body, count)
+    _write_varint(body, restart_interval)
+    for offset in restarts:
+        body += offset.to_bytes(OFFSET_BYTES, "big")
+    body += payload
+
+    block = bytearray()
+    _write_varint(block, len(body))
+    return bytes(block + body)
+
+
+def _parse_header(body) -> tuple[int, int, int, int]:
+    """Return (count, restart_interval, offsets_start, payload_start) for a block body."""
+    count, pos = _read_varint(body, 0)
+    restart_interval, pos = _read_varint(body, pos)
+    n_restarts = -(-count // restart_interval)
+    return count, restart_interval, pos, pos + n_restarts * OFFSET_BYTES
+
+
+def _iter_entries(body, pos: int, count: int, restart_interval: int) -> Iterator[int]:
+    """Decode `count` entries starting at the restart point located at `pos`."""
+    r = lat = lon = 0
+    for i in range(count):
+        if i % restart_interval == 0:
+            r, pos = _read_varint(body, pos)
+            lat, pos = _read_varint(body, pos)
+            lon, pos = _read_varint(body, pos)
+        else:
+            z, pos = _read_varint(body, pos)
+            r += zigzag_decode(z)
+            z, pos = _read_varint(body, pos)
+            lat += zigzag_decode(z)
+            z, pos = _read_varint(body, pos)
+            lon += zigzag_decode(z)
+        yield (r << 128) | (lat << 64) | lon
+
+
+def decode_block(body) -> Iterator[int]:
+    """Yield every UVoxID stored in a block body (without its length prefix)."""
+    count, restart_interval, _, payload_start = _parse_header(body)
+    return _iter_entries(body, payload_start, count, restart_interval)
+
+
+def block_get(body, index: int) -> int:
+    """
+    Random access into a single block body.
+
+    Seeks to the nearest restart point before `index` and decodes at most
+    `restart_interval` entries from there.
+    """
+    count, restart_interval, offsets_start, payload_start = _parse_header(body)
+    if not 0 <= index < count:
+        raise IndexError("block index out of range")
+
+    restart, steps = divmod(index, restart_interval)
+    off_pos = offsets_start + restart * OFFSET_BYTES
+    offset = int.from_bytes(body[off_pos:off_pos + OFFSET_BYTES], "big")
+
+    uv = 0
+    for uv in _iter_entries(body, payload_start + offset, steps + 1, restart_interval):
+        pass
+    return uv
+
+
+# --- Streams of blocks ---
+def iter_encode(uvoxids: Iterable[int],
+                block_size: int = DEFAULT_BLOCK_SIZE,
+                restart_interval: int = DEFAULT_RESTART_INTERVAL) -> Iterator[bytes]:
+    """
+    Streaming encoder: yield encoded blocks of up to `block_size` IDs.
+
+    Only one block of input is buffered at a time, so arbitrarily long
+    iterators can be written straight to a file.
+    """
+    if block_size < 1:
+        raise ValueError("block_size must be >= 1")
+
+    pending = []
+    for uv in uvoxids:
+        pending.append(uv)
+        if len(pending) == block_size:
+            yield encode_block(pending, restart_interval)
+            pending = []
+    if pending:
+        yield encode_block(pending, restart_interval)
+
+
+def compress_uvoxids(uvoxids: Iterable[int],
+                     block_size: int = DEFAULT_BLOCK_SIZE,
+                     restart_interval: int = DEFAULT_RESTART_INTERVAL) -> bytes:
+    """Compress a sequence of UVoxIDs into a single bytes object."""
+    return b"".join(iter_encode(uvoxids, block_size, restart_interval))
+
+
+def _iter_block_bodies(source: Union[bytes, bytearray, memoryview, BinaryIO]) -> Iterator[bytes]:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+
+    while True:
+        length = 0
+        shift = 0
+        while True:
+            b = source.read(1)
+            if not b:
+                if shift:
+                    raise ValueError("truncated block length")
+                return
+            byte = b[0]
+            length |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        body = source.read(length)
+        if len(body) != length:
+            raise ValueError("truncated block")
+        yield body
+
+
+def iter_decompress(source: Union[bytes, bytearray, memoryview, BinaryIO]) -> Iterator[int]:
+    """
+    Streaming decoder over compressed bytes or a binary file object.
+
+    Yields UVoxIDs in their original order, reading one block at a time.
+    """
+    for body in _iter_block_bodies(source):
+        yield from decode_block(body)
+
+
+def decompress_uvoxids(source: Union[bytes, bytearray, memoryview, BinaryIO]) -> list[int]:
+    """Decompress everything into a list of UVoxIDs."""
+    return list(iter_decompress(source))
+
+
+def uvoxid_at(data: bytes, index: int) -> int:
+    """
+    Return the UVoxID at position `index` in a compressed stream.
+
+    Whole blocks are skipped using their length prefix and entry count, so
+    only the target block is (partially) decoded.
+    """
+    if index < 0:
+        raise IndexError("index must be non-negative")
+
+    view = memoryview(data)
+    pos = 0
+    while pos < len(view):
+        length, body_start = _read_varint(view, pos)
+        body = view[body_start:body_start + length]
+        count, _ = _read_varint(body, 0)
+        if index < count:
+            return block_get(body, index)
+        index -= count
+        pos = body_start + length
+    raise IndexError("index out of range")
+
+
+def compression_stats(data: bytes) -> dict:
+    """
+    Report how well a compressed stream did against raw 24-byte records.
+
+    Returns:
+        dict with:
+          - count: number of UVoxIDs
+          - blocks: number of blocks
+          - raw_bytes: size as `uvoxid_to_bin` records (24 × count)
+          - compressed_bytes: size of `data`
+          - ratio: raw_bytes / compressed_bytes
+          - bytes_per_id: compressed_bytes / count
+    """
+    view = memoryview(data)
+    pos = 0
+    count = 0
+    blocks = 0
+    while pos < len(view):
+        length, body_start = _read_varint(view, pos)
+        n, _ = _read_varint(view, body_start)
+        count += n
+        blocks += 1
+        pos = body_start + length
+
+    raw_bytes = count * RAW_RECORD_BYTES
+    compressed_bytes = len(data)
+    return {
+        "count": count,
+        "blocks": blocks,
+        "raw_bytes": raw_bytes,
+        "compressed_bytes": compressed_bytes,
+        "ratio": raw_bytes / compressed_bytes if compressed_bytes else 0.0,
+        "bytes_per_id": compressed_bytes / count if count else 0.0,
+    }
+
+
+# --- Example usage ---
+if __name__ == "__main__":
+    from uvoxid.core import encode_uvoxid
+
+    EARTH_RADIUS_UM = 6_371_000_000_000
+    ids = sorted(
+        encode_uvoxid(EARTH_RADIUS_UM + dr, int(25.76 * 1e6) + i, int(-80.19 * 1e6) + i)
+        for dr in range(10) for i in range(1000)
+    )
+    packed = compress_uvoxids(ids)
+    assert decompress_uvoxids(packed) == ids
+    print(compression_stats(packed))
@@ -8,6 +8,19 @@ from uvoxid.core import decode_uvoxid
 VOXEL_SIZE_M = 1e-6  # 1 µm
 
 
+def cartesian_m(voxid: int) -> tuple[float, float, float]:
+    """
+    Cartesian (x, y, z) position of a voxel in meters, origin at the centre.
+
+    Chord distances between these points match `linear_distance`.
+    """
+    r, lat, lon = decode_uvoxid(voxid)
+    r_m = r * 1e-6
+    lat, lon = math.radians(lat / 1e6), math.radians(lon / 1e6)
+    cos_lat = math.cos(lat)
+    return r_m * cos_lat * math.cos(lon), r_m * cos_lat * math.sin(lon), r_m * math.sin(lat)
+
+
 def linear_distance(voxid1: int, voxid2: int) -> float:
     """
     Straight-line (chord) distance between two voxels in meters.
@@ -0,0 +1,140 @@
+"""
+join.py — spatial join / proximity detection between two UVoxID sets.
+
+Both sides are converted to Cartesian meters and hashed into a uniform grid
+whose cell edge equals the distance threshold. Any pair within the
+threshold must then lie in the same or an adjacent grid cell, so each left
+voxel is compared only against the right voxels in its 27 surrounding
+cells instead of the whole right set.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+from typing import Iterable, Iterator, Optional
+
+from .distance import cartesian_m
+
+_ADJACENT = tuple(product((-1, 0, 1), repeat=3))
+
+
+def _grid_cell(x: float, y: float, z: float, size: float) -> tuple[int, int, int]:
+    return math.floor(x / size), math.floor(y / size), math.floor(z / size)
+
+
+def _build_grid(points, size: float) -> dict:
+    grid = {}
+    for uv, (x, y, z) in points:
+        grid.setdefault(_grid_cell(x, y, z, size), []).append((uv, x, y, z))
+    return grid
+
+
+def _probe(points, grid: dict, threshold_m: float) -> Iterator[tuple[int, int, float]]:
+    limit_sq = threshold_m * threshold_m
+    size = threshold_m
+    for uv, (x, y, z) in points:
+        cx, cy, cz = _grid_cell(x, y, z, size)
+        for dx, dy, dz in _ADJACENT:
+            bucket = grid.get((cx + dx, cy + dy, cz + dz))
+            if not bucket:
+                continue
+            for ruv, rx, ry, rz in bucket:
+                d_sq = (x - rx) ** 2 + (y - ry) ** 2 + (z - rz) ** 2
+                if d_sq <= limit_sq:
+                    yield uv, ruv, math.sqrt(d_sq)
+
+
+def _with_xyz(uvoxids: Iterable[int]) -> Iterator[tuple[int, tuple[float, float, float]]]:
+    for uv in uvoxids:
+        yield uv, cartesian_m(uv)
+
+
+def spatial_join(left: Iterable[int], right: Iterable[int],
+                 threshold_m: float) -> Iterator[tuple[int, int, float]]:
+    """
+    Stream all (left, right) pairs whose chord distance is <= threshold_m.
+
+    The right side is indexed in memory; the left side is consumed lazily,
+    so pass the larger set as `left`.
+
+    Args:
+        left: UVoxID integers (streamed).
+        right: UVoxID integers (indexed).
+        threshold_m (float): maximum straight-line distance in meters.
+
+    Yields:
+        (left_uvoxid, right_uvoxid, distance_m)
+    """
+    if threshold_m <= 0:
+        raise ValueError("threshold_m must be positive")
+    grid = _build_grid(_with_xyz(right), threshold_m)
+    yield from _probe(_with_xyz(left), grid, threshold_m)
+
+
+def _join_partition(args) -> list[tuple[int, int, float]]:
+    left_points, right_points, threshold_m = args
+    grid = _build_grid(right_points, threshold_m)
+    return list(_probe(left_points, grid, threshold_m))
+
+
+def spatial_join_parallel(left: Iterable[int], right: Iterable[int],
+                          threshold_m: float,
+                          partitions: Optional[int] = None,
+                          max_workers: Optional[int] = None) -> Iterator[tuple[int, int, float]]:
+    """
+    Partitioned, multi-process variant of `spatial_join`.
+
+    Voxels are split into partitions by their grid cell along x. Each left
+    voxel belongs to exactly one partition; right voxels are also copied
+    into the partitions of the neighbouring x-slabs, so every matching pair
+    is found exactly once. Partitions are joined in worker processes and
+    their results streamed back as they complete.
+
+    Args:
+        left, right: UVoxID integers.
+        threshold_m (float): maximum straight-line distance in meters.
+        partitions (int): number of partitions (default: 4 × workers).
+        max_workers (int): worker processes (default: CPU count).
+
+    Yields:
+        (left_uvoxid, right_uvoxid, distance_m), in no particular order.
+    """
+    if threshold_m <= 0:
+        raise ValueError("threshold_m must be positive")
+
+    max_workers = max_workers or os.cpu_count() or 1
+    n_parts = partitions or 4 * max_workers
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        left_parts = [[] for _ in range(n_parts)]
+        right_parts = [[] for _ in range(n_parts)]
+
+        for uv, xyz in _with_xyz(left):
+            ix = math.floor(xyz[0] / threshold_m)
+            left_parts[ix % n_parts].append((uv, xyz))
+
+        for uv, xyz in _with_xyz(right):
+            ix = math.floor(xyz[0] / threshold_m)
+            for part in {(ix - 1) % n_parts, ix % n_parts, (ix + 1) % n_parts}:
+                right_parts[part].append((uv, xyz))
+
+        futures = [
+            executor.submit(_join_partition, (lp, rp, threshold_m))
+            for lp, rp in zip(left_parts, right_parts)
+            if lp and rp
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+# --- Example usage ---
+if __name__ == "__main__":
+    from ..core import encode_uvoxid
+
+    EARTH_RADIUS_UM = 6_371_000_000_000
+    sensors = [encode_uvoxid(EARTH_RADIUS_UM, lat * 10_000, 0) for lat in range(100)]
+    assets = [encode_uvoxid(EARTH_RADIUS_UM, lat * 10_000 + 50, 0) for lat in range(100)]
+
+    pairs = list(spatial_join(sensors, assets, threshold_m=50.0))
+    print(f"{len(pairs)} sensor/asset pairs within 50 m")
@@ -0,0 +1,186 @@
+"""
+neighbors.py — adjacent voxel enumeration at a given tolerance level.
+
+A tolerance level (sig_chars) keeps the top `sig_chars * 5` bits of the
+192-bit UVoxID. Depending on where that cut falls, each field (r, lat, lon)
+is either fully collapsed (no neighbours along that axis) or quantized into
+cells of `2**unused_bits` raw units. Neighbours are found by stepping one
+cell along each active axis, then:
+
+  - wrapping longitude around ±180° by cell index, so the partial last
+    longitude cell is not skipped,
+  - crossing the pole (same latitude row, longitude rotated by half the
+    cell count) when a latitude step runs off the top or bottom row; with
+    an odd cell count the half turn falls between two cells and both are
+    neighbours, which keeps the relation symmetric,
+  - dropping steps that would make the radius negative or overflow.
+"""
+
+from functools import lru_cache
+from itertools import product
+from typing import Iterable, Optional
+
+from .tolerance import TOTAL_BITS, BITS_PER_CHAR, truncate_to_tolerance
+
+FIELD_BITS = 64
+MASK64 = (1 << FIELD_BITS) - 1
+
+LAT_SPAN = 180_000_000   # encoded latitude range (microdegrees)
+LON_SPAN = 360_000_000   # encoded longitude range (microdegrees)
+
+
+@lru_cache(maxsize=None)
+def field_steps(sig_chars: int) -> tuple[Optional[int], Optional[int], Optional[int]]:
+    """
+    Cell size, in raw field units, of (r, lat, lon) at a tolerance level.
+
+    An entry is None when that field is entirely truncated away or when one
+    cell already spans the whole field domain, i.e. the axis has no neighbours.
+    """
+    keep_bits = sig_chars * BITS_PER_CHAR
+    if not 0 < keep_bits <= TOTAL_BITS:
+        raise ValueError(f"sig_chars must be between 1 and {TOTAL_BITS // BITS_PER_CHAR}")
+
+    steps = []
+    for field, span in enumerate((None, LAT_SPAN, LON_SPAN)):
+        kept = min(max(keep_bits - field * FIELD_BITS, 0), FIELD_BITS)
+        if kept == 0:
+            steps.append(None)
+            continue
+        step = 1 << (FIELD_BITS - kept)
+        steps.append(None if span is not None and step >= span else step)
+    return tuple(steps)
+
+
+@lru_cache(maxsize=None)
+def neighbor_offsets(sig_chars: int, connectivity: int = 6) -> tuple[tuple[int, int, int], ...]:
+    """
+    Precomputed (dr, dlat, dlon) offsets, in raw field units, for a tolerance
+    level and connectivity (6 = faces, 26 = faces + edges + corners).
+    """
+    if connectivity not in (6, 26):
+        raise ValueError("connectivity must be 6 or 26")
+
+    steps = [s or 0 for s in field_steps(sig_chars)]
+    offsets = set()
+    for d in product((-1, 0, 1), repeat=3):
+        if d == (0, 0, 0):
+            continue
+        if connectivity == 6 and sum(map(abs, d)) != 1:
+            continue
+        offset = (d[0] * steps[0], d[1] * steps[1], d[2] * steps[2])
+        if offset != (0, 0, 0):
+            offsets.add(offset)
+    return tuple(sorted(offsets))
+
+
+@lru_cache(maxsize=None)
+def cell_counts(sig_chars: int) -> tuple[int, int]:
+    """
+    Number of (lat, lon) cells at a tolerance level.
+
+    Neither span is a multiple of the cell size in general, so the last
+    latitude/longitude cell is a partial one; wrapping has to count it.
+    Collapsed axes report a single cell.
+    """
+    _, slat, slon = field_steps(sig_chars)
+    lat_cells = LAT_SPAN // slat + 1 if slat else 1  # encoded lat includes +90°
+    lon_cells = -(-LON_SPAN // slon) if slon else 1
+    return lat_cells, lon_cells
+
+
+def _neighbors_of_cell(cell: int, sig_chars: int, offsets) -> set[int]:
+    _, slat, slon = field_steps(sig_chars)
+    lat_cells, lon_cells = cell_counts(sig_chars)
+
+    r = (cell >> 128) & MASK64
+    lat_idx = ((cell >> 64) & MASK64) // slat if slat else 0
+    lon_idx = (cell & MASK64) // slon if slon else 0
+    # Longitude cells on the far side of the pole, used when a latitude step
+    # runs off the top or bottom row. Rotating by index (forwards and back)
+    # makes the pole partner relation its own inverse.
+    half = lon_cells // 2
+    pole_lon_idxs = {(lon_idx + half) % lon_cells, (lon_idx - half) % lon_cells}
+
+    out = set()
+    for dr, dlat, dlon in offsets:
+        nr = r + dr
+        if nr < 0 or nr > MASK64:
+            continue
+
+        nlat_idx = lat_idx + (dlat // slat if dlat else 0)
+        nlon_idxs = (lon_idx,)
+        if nlat_idx < 0 or nlat_idx >= lat_cells:
+            nlat_idx = lat_idx
+            nlon_idxs = pole_lon_idxs
+
+        nlat = nlat_idx * slat if slat else 0
+        for nlon_idx in nlon_idxs:
+            nlon_idx = (nlon_idx + (dlon // slon if dlon else 0)) % lon_cells
+            nlon = nlon_idx * slon if slon else 0
+            n = (nr << 128) | (nlat << 64) | nlon
+            if n != cell:
+                out.add(n)
+    return out
+
+
+def voxel_neighbors(uvoxid: int, sig_chars: int, connectivity: int = 6) -> list[int]:
+    """
+    Cells adjacent to the cell containing `uvoxid` at a tolerance level.
+
+    Args:
+        uvoxid (int): 192-bit UVoxID integer.
+        sig_chars (int): tolerance level (number of Base32 chars kept).
+        connectivity (int): 6 (face) or 26 (face/edge/corner) neighbours.
+
+    Returns:
+        list[int]: sorted, deduplicated truncated UVoxIDs of neighbouring
+        cells (never includes the cell itself).
+    """
+    cell = truncate_to_tolerance(uvoxid, sig_chars)
+    offsets = neighbor_offsets(sig_chars, connectivity)
+    return sorted(_neighbors_of_cell(cell, sig_chars, offsets))
+
+
+def batch_neighbors(uvoxids: Iterable[int], sig_chars: int,
+                    connectivity: int = 6,
+                    include_sources: bool = False) -> list[int]:
+    """
+    Union of neighbouring cells for many UVoxIDs.
+
+    Inputs are truncated and deduplicated first, so each source cell is
+    expanded only once.
+
+    Args:
+        uvoxids: UVoxID integers.
+        sig_chars (int): tolerance level.
+        connectivity (int): 6 or 26.
+        include_sources (bool): keep the source cells themselves in the
+            result (False gives just the surrounding frontier).
+
+    Returns:
+        list[int]: sorted, deduplicated truncated UVoxIDs.
+    """
+    offsets = neighbor_offsets(sig_chars, connectivity)
+    cells = {truncate_to_tolerance(uv, sig_chars) for uv in uvoxids}
+
+    out = set()
+    for cell in cells:
+        out |= _neighbors_of_cell(cell, sig_chars, offsets)
+
+    if include_sources:
+        out |= cells
+    else:
+        out -= cells
+    return sorted(out)
+
+
+# --- Example usage ---
+if __name__ == "__main__":
+    from ..core import encode_uvoxid, decode_uvoxid
+
+    EARTH_RADIUS_UM = 6_371_000_000_000
+    uv = encode_uvoxid(EARTH_RADIUS_UM, 0, 180_000_000 - 1)
+
+    for n in voxel_neighbors(uv, 36):
+        print(decode_uvoxid(n))
@@ -0,0 +1,315 @@
+"""
+pyramid.py — incrementally maintained multi-resolution aggregates (LOD).
+
+An AggregationPyramid keeps one aggregate per tolerance cell for each
+configured sig_chars level, keyed by `truncate_to_tolerance` prefixes.
+Inserting or removing a voxel touches exactly one cell per level, and each
+level also records which finer cells sit under every coarser cell so that
+"all cells at level L inside prefix P" is answered by walking down the
+pyramid instead of scanning every cell.
+
+Reducers are pluggable: anything implementing `empty / add / remove /
+merge / result` works. Count, sum, min and max are provided.
+"""
+
+from collections import Counter
+from typing import Iterable, Optional, Union
+
+from .tolerance import TOTAL_BITS, BITS_PER_CHAR, truncate_to_tolerance
+
+MAX_SIG_CHARS = TOTAL_BITS // BITS_PER_CHAR
+
+
+# --- Reducers ---
+class CountReducer:
+    """Number of voxels in the cell (values are ignored)."""
+
+    def empty(self):
+        return 0
+
+    def add(self, state, value):
+        return state + 1
+
+    def remove(self, state, value):
+        return state - 1
+
+    def merge(self, a, b):
+        return a + b
+
+    def result(self, state):
+        return state
+
+
+class SumReducer:
+    """Sum of the inserted values."""
+
+    def empty(self):
+        return 0
+
+    def add(self, state, value):
+        return state + value
+
+    def remove(self, state, value):
+        return state - value
+
+    def merge(self, a, b):
+        return a + b
+
+    def result(self, state):
+        return state
+
+
+class MinReducer:
+    """
+    Minimum of the inserted values.
+
+    The state is a multiset of values so that removals stay exact.
+    """
+
+    def empty(self):
+        return Counter()
+
+    def add(self, state, value):
+        state[value] += 1
+        return state
+
+    def remove(self, state, value):
+        if value not in state:
+            raise KeyError(f"value {value!r} was never added to this cell")
+        state[value] -= 1
+        if state[value] <= 0:
+            del state[value]
+        return state
+
+    def merge(self, a, b):
+        a.update(b)
+        return a
+
+    def result(self, state):
+        return min(state) if state else None
+
+
+class MaxReducer(MinReducer):
+    """Maximum of the inserted values."""
+
+    def result(self, state):
+        return max(state) if state else None
+
+
+REDUCERS = {
+    "count": CountReducer,
+    "sum": SumReducer,
+    "min": MinReducer,
+    "max": MaxReducer,
+}
+
+
+class AggregationPyramid:
+    """
+    Per-level aggregates of voxel attributes.
+
+    Args:
+        levels: sig_chars levels to maintain, coarse to fine (default: all).
+        reducer: "count", "sum", "min", "max" or a reducer instance.
+    """
+
+    def __init__(self, levels: Optional[Iterable[int]] = None,
+                 reducer: Union[str, object] = "count"):
+        levels = sorted(set(levels)) if levels is not None else list(range(1, MAX_SIG_CHARS + 1))
+        if not levels or levels[0] < 1 or levels[-1] > MAX_SIG_CHARS:
+            raise ValueError(f"levels must be between 1 and {MAX_SIG_CHARS}")
+        if isinstance(reducer, str):
+            if reducer not in REDUCERS:
+                raise ValueError(f"unknown reducer {reducer!r}, expected one of {sorted(REDUCERS)}")
+            reducer = REDUCERS[reducer]()
+
+        self.levels = tuple(levels)
+        self.reducer = reducer
+        self._index = {level: i for i, level in enumerate(self.levels)}
+        # cells[i]: key → [voxel_count, reducer_state]
+        self._cells = [dict() for _ in self.levels]
+        # children[i]: key at level i-1 → set of keys at level i (unused for i = 0)
+        self._children = [dict() for _ in self.levels]
+
+    def __len__(self) -> int:
+        """Number of voxels currently aggregated."""
+        return sum(cell[0] for cell in self._cells[0].values())
+
+    def _keys(self, uvoxid: int) -> list[int]:
+        return [truncate_to_tolerance(uvoxid, level) for level in self.levels]
+
+    # --- Incremental updates ---
+    def insert(self, uvoxid: int, value=1) -> None:
+        """Add one voxel (with its attribute value) to every level."""
+        reducer = self.reducer
+        parent = None
+        for i, key in enumerate(self._keys(uvoxid)):
+            cells = self._cells[i]
+            cell = cells.get(key)
+            if cell is None:
+                cell = cells[key] = [0, reducer.empty()]
+                if i > 0:
+                    self._children[i].setdefault(parent, set()).add(key)
+            cell[0] += 1
+            cell[1] = reducer.add(cell[1], value)
+            parent = key
+
+    def remove(self, uvoxid: int, value=1) -> None:
+        """
+        Remove one previously inserted voxel (with the value it was inserted with).
+
+        Levels are updated finest first, so a reducer that rejects the value
+        (min/max raise KeyError for a value the cell never saw) does so
+        before anything has changed.
+
+        Raises:
+            KeyError: if the voxel's cell is not present, or the reducer
+                rejects `value`.
+        """
+        keys = self._keys(uvoxid)
+        if keys[-1] not in self._cells[-1]:
+            raise KeyError(f"no aggregated voxel at {uvoxid:#x}")
+
+        reducer = self.reducer
+        for i in range(len(keys) - 1, -1, -1):
+            key = keys[i]
+            cells = self._cells[i]
+            cell = cells[key]
+            cell[1] = reducer.remove(cell[1], value)
+            cell[0] -= 1
+            if cell[0] == 0:
+                del cells[key]
+                if i > 0:
+                    siblings = self._children[i][keys[i - 1]]
+                    siblings.discard(key)
+                    if not siblings:
+                        del self._children[i][keys[i - 1]]
+
+    # --- Bulk build ---
+    def build(self, items: Iterable) -> None:
+        """
+        Bulk-insert voxels, aggregating the finest level first and rolling
+        each coarser level up from the one below it.
+
+        Args:
+            items: iterable of (uvoxid, value) pairs, or plain UVoxIDs
+                (value 1) for counting.
+        """
+        reducer = self.reducer
+        finest = self.levels[-1]
+
+        level_cells = {}
+        for item in items:
+            uv, value = item if isinstance(item, tuple) else (item, 1)
+            key = truncate_to_tolerance(uv, finest)
+            cell = level_cells.get(key)
+            if cell is None:
+                cell = level_cells[key] = [0, reducer.empty()]
+            cell[0] += 1
+            cell[1] = reducer.add(cell[1], value)
+
+        for i in range(len(self.levels) - 1, -1, -1):
+            coarser = {}
+            parent_level = self.levels[i - 1] if i > 0 else None
+            cells = self._cells[i]
+            for key, (n, state) in level_cells.items():
+                existing = cells.get(key)
+                if existing is None:
+                    cells[key] = [n, state]
+                else:
+                    existing[0] += n
+                    existing[1] = reducer.merge(existing[1], state)
+
+                if parent_level is None:
+                    continue
+                parent = truncate_to_tolerance(key, parent_level)
+                self._children[i].setdefault(parent, set()).add(key)
+                pcell = coarser.get(parent)
+                if pcell is None:
+                    coarser[parent] = [n, reducer.merge(reducer.empty(), state)]
+                else:
+                    pcell[0] += n
+                    pcell[1] = reducer.merge(pcell[1], state)
+            level_cells = coarser
+
+    # --- Queries ---
+    def value(self, uvoxid: int, level: int):
+        """Aggregate of the cell containing `uvoxid` at `level` (None if empty)."""
+        i = self._level_index(level)
+        cell = self._cells[i].get(truncate_to_tolerance(uvoxid, level))
+        return self.reducer.result(cell[1]) if cell else None
+
+    def count(self, uvoxid: int, level: int) -> int:
+        """Number of voxels in the cell containing `uvoxid` at `level`."""
+        i = self._level_index(level)
+        cell = self._cells[i].get(truncate_to_tolerance(uvoxid, level))
+        return cell[0] if cell else 0
+
+    def cells(self, level: int, prefix: Optional[int] = None,
+              prefix_sig_chars: Optional[int] = None) -> dict:
+        """
+        All non-empty cells at `level`, optionally restricted to those under
+        a coarser prefix.
+
+        Args:
+            level (int): sig_chars level to report (must be maintained).
+            prefix (int): any UVoxID inside the region of interest.
+            prefix_sig_chars (int): tolerance defining the region (<= level).
+
+        Returns:
+            dict mapping truncated UVoxID → aggregate value.
+        """
+        target = self._level_index(level)
+        result = self.reducer.result
+
+        if prefix is None:
+            return {key: result(cell[1]) for key, cell in self._cells[target].items()}
+        if prefix_sig_chars is None or prefix_sig_chars > level:
+            raise ValueError("prefix_sig_chars must be given and <= level")
+
+        region = truncate_to_tolerance(prefix, prefix_sig_chars)
+
+        # Start from the finest maintained level no finer than the prefix and
+        # walk down the children maps. Only the first step below the prefix
+        # can reach cells outside the region, so only that step is filtered.
+        start = max((i for i, lvl in enumerate(self.levels) if lvl <= prefix_sig_chars),
+                    default=None)
+        if start is None:
+            keys = [k for k in self._cells[0]
+                    if truncate_to_tolerance(k, prefix_sig_chars) == region]
+            first, needs_filter = 1, False
+        else:
+            start_key = truncate_to_tolerance(region, self.levels[start])
+            keys = [start_key] if start_key in self._cells[start] else []
+            first, needs_filter = start + 1, self.levels[start] < prefix_sig_chars
+
+        for i in range(first, target + 1):
+            children = self._children[i]
+            keys = [c for k in keys for c in children.get(k, ())]
+            if needs_filter:
+                keys = [k for k in keys
+                        if truncate_to_tolerance(k, prefix_sig_chars) == region]
+                needs_filter = False
+
+        cells = self._cells[target]
+        return {key: result(cells[key][1]) for key in keys}
+
+    def _level_index(self, level: int) -> int:
+        try:
+            return self._index[level]
+        except KeyError:
+            raise ValueError(f"level {level} is not maintained (levels: {self.levels})") from None
+
+
+# --- Example usage ---
+if __name__ == "__main__":
+    from ..core import encode_uvoxid
+
+    EARTH_RADIUS_UM = 6_371_000_000_000
+    pyramid = AggregationPyramid(levels=(26, 30, 34), reducer="sum")
+    pyramid.build(
+        (encode_uvoxid(EARTH_RADIUS_UM, lat, lon), 1.5)
+        for lat in range(0, 100_000, 1_000) for lon in range(0, 100_000, 1_000)
+    )
+    for level in pyramid.levels:
+        print(level, "→", len(pyramid.cells(level)), "cells")
@@ -0,0 +1,458 @@
+"""
+raster.py — voxel rasterization of paths between two UVoxIDs.
+
+Walks a straight chord or a great-circle path (with linearly varying
+radius) and yields, in order, the tolerance cells it passes through.
+
+The path is first split at the points where a field stops being monotonic
+or wraps:
+
+  - where latitude peaks (the great circle's vertex),
+  - where the chord comes closest to the centre (radius minimum),
+  - where it crosses the antimeridian (longitude wraps ±180°),
+  - where it passes through a pole (longitude jumps by 180°).
+
+Within each piece every field moves in one direction, so the walk is a
+DDA in integer (r, lat, lon) cell-index space: for each axis it keeps the
+parameter at which the path reaches that axis' next cell boundary and
+steps the index of whichever axis gets there first. Those parameters are
+solved in closed form: a latitude or longitude boundary is a plane that
+cuts the path's great circle at a known angle, and a radius boundary is
+a linear (great circle) or quadratic (chord) equation. Each piece takes
+exactly as many steps as its start and end cells are apart.
+
+Between pieces the walk steps across the antimeridian (last longitude cell
+↔ first) or over the pole (same latitude row, longitude index rotated by
+half the cell count, as in `voxel_neighbors`).
+
+At a turn (radius minimum or latitude peak) the path can dip into a
+neighbouring cell along the turning axis and come straight back out
+without any other axis changing. Such out-and-back excursions are folded
+away, so every cell is reported once and consecutive cells stay adjacent.
+The folded cells are ones the path only grazes while it turns inside a
+single column of cells.
+"""
+
+import math
+from typing import Iterable, Iterator
+
+from ..core import decode_uvoxid
+from .neighbors import field_steps, cell_counts
+
+MODES = ("great_circle", "chord")
+
+_TIE = 1e-12          # boundary crossings this close (in path parameter) are simultaneous
+_ANTIPODAL_EPS = 1e-12
+
+_INF = math.inf
+_TWO_PI = 2 * math.pi
+
+
+def _unit(lat_microdeg: float, lon_microdeg: float) -> tuple[float, float, float]:
+    phi, lam = math.radians(lat_microdeg / 1e6), math.radians(lon_microdeg / 1e6)
+    return math.cos(phi) * math.cos(lam), math.cos(phi) * math.sin(lam), math.sin(phi)
+
+
+def _dot(a, b) -> float:
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _wrap_lon(lon: float, ref: float) -> float:
+    """Express a longitude (µdeg) on the same side of ±180° as `ref`."""
+    return ref + ((lon - ref + 180e6) % 360e6 - 180e6)
+
+
+class _Path:
+    """
+    A path parameterised by f in [0, 1].
+
+    Its direction always lies on the great circle through both endpoints:
+    dir(θ) = u1·cos θ + w·sin θ. Great-circle mode moves θ linearly in f;
+    chord mode moves θ monotonically (a straight line seen from the centre
+    sweeps its plane in one direction).
+    """
+
+    def __init__(self, fields1, fields2, mode: str):
+        r1, lat1, lon1 = fields1
+        r2, lat2, lon2 = fields2
+        self.r1, self.r2 = r1, r2
+        self.lon1, self.lon2 = lon1, lon2
+        self.chord = mode == "chord"
+        # Endpoints on opposite meridians: the path runs up one meridian,
+        # over the pole and down the other. Decided on the integer fields,
+        # since the vertex direction is too noisy to test against the pole.
+        self.over_pole = (
+            (lon2 - lon1) % 360_000_000 == 180_000_000
+            and max(abs(lat1), abs(lat2)) < 90_000_000 and lat1 + lat2 != 0
+        )
+        # An endpoint on a pole has no real longitude: the path runs along
+        # the other endpoint's meridian.
+        self.at_pole = (abs(lat1) == 90_000_000, abs(lat2) == 90_000_000)
+        self.meridian = lon1 if self.at_pole[1] else lon2
+
+        u1, u2 = _unit(lat1, lon1), _unit(lat2, lon2)
+        cos_omega = _dot(u1, u2)
+        perp = tuple(b - cos_omega * a for a, b in zip(u1, u2))
+        residue = _dot(perp, u1)  # second Gram-Schmidt pass: short arcs cancel badly
+        perp = tuple(p - residue * a for p, a in zip(perp, u1))
+        norm = math.sqrt(_dot(perp, perp))
+        if norm < _ANTIPODAL_EPS and cos_omega < 0:
+            raise ValueError("antipodal endpoints: the path between them is not unique")
+        if norm < 1e-15:
+            omega, w = 0.0, (0.0, 0.0, 0.0)
+        else:
+            w = tuple(c / norm for c in perp)
+            # atan2 rather than acos: acos loses all precision on short arcs
+            omega = math.atan2(_dot(u2, w), cos_omega)
+
+        self.u1, self.w, self.omega = u1, w, omega
+        self.p1 = tuple(r1 * c for c in u1)
+        self.d = tuple(r2 * b - r1 * a for a, b in zip(u1, u2))
+
+    # --- parameterisation ---
+    def theta(self, f: float) -> float:
+        if self.omega == 0.0:
+            return 0.0
+        if not self.chord:
+            return f * self.omega
+        p = tuple(a + f * b for a, b in zip(self.p1, self.d))
+        return math.atan2(_dot(p, self.w), _dot(p, self.u1))
+
+    def f_of_theta(self, theta: float):
+        if not self.chord:
+            return theta / self.omega
+        # p(f)·q = 0 with q ⟂ dir(θ) in the path plane
+        q = tuple(-math.sin(theta) * a + math.cos(theta) * b for a, b in zip(self.u1, self.w))
+        dq = _dot(self.d, q)
+        return None if dq == 0 else self.r1 * math.sin(theta) / dq
+
+    def radius(self, f: float) -> float:
+        if not self.chord:
+            return self.r1 + (self.r2 - self.r1) * f
+        p = tuple(a + f * b for a, b in zip(self.p1, self.d))
+        return math.sqrt(_dot(p, p))
+
+    def direction(self, theta: float):
+        c, s = math.cos(theta), math.sin(theta)
+        return tuple(c * a + s * b for a, b in zip(self.u1, self.w))
+
+    def fields(self, f: float, lon_ref: float) -> tuple[float, float, float]:
+        """Raw (r, lat_enc, lon_enc) at f, longitude kept near `lon_ref`."""
+        x, y, z = self.direction(self.theta(f))
+        lat = math.degrees(math.asin(max(-1.0, min(1.0, z)))) * 1e6
+        lon = _wrap_lon(math.degrees(math.atan2(y, x)) * 1e6, lon_ref)
+        return self.radius(f), lat + 90e6, lon + 180e6
+
+    def lon_ref(self, fa: float, fb: float, f_pole) -> float:
+        """Longitude (µdeg) a piece's values are unwrapped around."""
+        if f_pole is not None:
+            return self.lon1 if fb <= f_pole else self.lon2
+        if any(self.at_pole):
+            return self.meridian
+        x, y, _ = self.direction(self.theta((fa + fb) / 2))
+        return math.degrees(math.atan2(y, x)) * 1e6
+
+    # --- closed-form boundary crossings ---
+    def _thetas_to_f(self, thetas, f_lo: float, f_hi: float):
+        """Smallest f in [f_lo, f_hi] among the given angles (any turn of 2π)."""
+        t_lo, t_hi = self.theta(f_lo), self.theta(f_hi)
+        best = None
+        for t in thetas:
+            t += _TWO_PI * math.ceil((t_lo - _TIE - t) / _TWO_PI)  # first copy from t_lo on
+            if t > t_hi + _TIE:
+                continue
+            f = self.f_of_theta(min(max(t, t_lo), t_hi))
+            if f is not None and f_lo - _TIE <= f <= f_hi + _TIE and (best is None or f < best):
+                best = f
+        return best
+
+    def lat_crossing(self, lat_enc: float, f_lo: float, f_hi: float):
+        """First f in [f_lo, f_hi] where the path reaches latitude `lat_enc`."""
+        a, b = self.u1[2], self.w[2]
+        amp = math.hypot(a, b)
+        if amp == 0:
+            return None
+        c = math.sin(math.radians((lat_enc - 90e6) / 1e6)) / amp
+        if abs(c) > 1:
+            return None
+        phi, delta = math.atan2(b, a), math.acos(c)
+        return self._thetas_to_f((phi - delta, phi + delta), f_lo, f_hi)
+
+    def lon_crossing(self, lon_enc: float, f_lo: float, f_hi: float):
+        """First f in [f_lo, f_hi] where the path reaches meridian `lon_enc`."""
+        lam = math.radians((lon_enc - 180e6) / 1e6)
+        normal = (-math.sin(lam), math.cos(lam), 0.0)
+        along = (math.cos(lam), math.sin(lam), 0.0)
+        a, b = _dot(self.u1, normal), _dot(self.w, normal)
+        if a == 0 and b == 0:
+            return None
+        t0 = math.atan2(-a, b)
+        # The plane holds the meridian and its opposite; keep the right half.
+        thetas = [t for t in (t0, t0 + math.pi) if _dot(self.direction(t), along) > 0]
+        return self._thetas_to_f(thetas, f_lo, f_hi)
+
+    def r_crossing(self, r: float, f_lo: float, f_hi: float):
+        """First f in [f_lo, f_hi] where the path reaches radius `r`."""
+        if not self.chord:
+            if self.r2 == self.r1:
+                return None
+            roots = [(r - self.r1) / (self.r2 - self.r1)]
+        else:
+            # |p1 + f·d|² = r²  →  dd·f² + 2·pd·f + (r1 − r)(r1 + r) = 0
+            dd, pd = _dot(self.d, self.d), _dot(self.p1, self.d)
+            c = (self.r1 - r) * (self.r1 + r)
+            disc = pd * pd - dd * c
+            if dd == 0 or disc < 0:
+                return None
+            q = -(pd + math.copysign(math.sqrt(disc), pd))
+            roots = [q / dd] + ([c / q] if q != 0 else [])
+        hits = [f for f in roots if f_lo - _TIE <= f <= f_hi + _TIE]
+        return min(hits) if hits else None
+
+    # --- split points ---
+    def splits(self) -> list[tuple[float, str]]:
+        """Interior (f, kind) points where a field turns or wraps."""
+        out = []
+        if self.chord:
+            dd = _dot(self.d, self.d)
+            if dd > 0:
+                out.append((-_dot(self.p1, self.d) / dd, "turn"))
+
+        if self.omega > 0 and not any(self.at_pole):
+            u1, w = self.u1, self.w
+
+            # Latitude extremes: z(θ) = u1z cos θ + wz sin θ
+            if math.hypot(u1[2], w[2]) > 0:
+                t0 = math.atan2(w[2], u1[2])
+                for t in (t0 - math.pi, t0, t0 + math.pi):
+                    if 0 < t < self.omega:
+                        kind = "pole" if self.over_pole else "turn"
+                        out.append((self.f_of_theta(t), kind))
+
+            # Antimeridian: y(θ) = 0 with x < 0 (an over-the-pole path
+            # stays on its two meridians and never crosses it)
+            if not self.over_pole and math.hypot(u1[1], w[1]) > 0:
+                t0 = math.atan2(-u1[1], w[1])
+                for t in (t0 - math.pi, t0, t0 + math.pi):
+                    if 0 < t < self.omega:
+                        x, y, _ = self.direction(t)
+                        if x < 0:
+                            out.append((self.f_of_theta(t), "antimeridian"))
+
+        out = sorted((f, kind) for f, kind in out if f is not None and 0 < f < 1)
+        merged = []
+        for f, kind in out:
+            if merged and f - merged[-1][0] < _TIE:
+                if kind != "turn":
+                    merged[-1] = (merged[-1][0], kind)
+                continue
+            merged.append((f, kind))
+        return merged
+
+
+def _row_walk(lon_from: int, lon_to: int, lon_cells: int) -> list[int]:
+    """Longitude indices after `lon_from` up to `lon_to`, the short way round."""
+    out = []
+    fwd = (lon_to - lon_from) % lon_cells
+    step = 1 if fwd <= lon_cells - fwd else -1
+    while lon_from != lon_to:
+        lon_from = (lon_from + step) % lon_cells
+        out.append(lon_from)
+    return out
+
+
+def _walk_piece(path: _Path, fa: float, fb: float, start, end,
+                steps, connectivity: int) -> Iterator[tuple[int, int, int]]:
+    """DDA over one monotonic piece, yielding every cell index after `start`."""
+    cur = list(start)
+    sign = [(e > s) - (e < s) for s, e in zip(start, end)]
+    solvers = (path.r_crossing, path.lat_crossing, path.lon_crossing)
+
+    def crossing(axis: int, f_lo: float) -> float:
+        """Parameter at which the path leaves cur[axis] towards end[axis]."""
+        boundary = (cur[axis] + (sign[axis] > 0)) * steps[axis]
+        f = solvers[axis](boundary, f_lo, fb)
+        # No root left in the piece only happens through rounding at its
+        # end; the end cell says the boundary is crossed, so cross it there.
+        return fb if f is None else min(max(f, f_lo), fb)
+
+    next_f = [crossing(a, fa) if cur[a] != end[a] else _INF for a in range(3)]
+    while next_f != [_INF, _INF, _INF]:
+        f_min = min(next_f)
+        if connectivity == 26:
+            axes = [a for a in range(3) if next_f[a] - f_min <= _TIE]
+        else:
+            axes = [next_f.index(f_min)]
+
+        for a in axes:
+            cur[a] += sign[a]
+        yield tuple(cur)
+
+        for a in axes:
+            next_f[a] = crossing(a, f_min) if cur[a] != end[a] else _INF
+
+
+def rasterize_path(uv1: int, uv2: int, sig_chars: int,
+                   mode: str = "great_circle",
+                   connectivity: int = 6) -> Iterator[int]:
+    """
+    Lazily yield the tolerance cells crossed by the path from uv1 to uv2.
+
+    Args:
+        uv1 (int): start UVoxID.
+        uv2 (int): end UVoxID.
+        sig_chars (int): tolerance level of the cells.
+        mode (str): "great_circle" (slerp + linear radius, as in
+            `interpolate_uvoxid`) or "chord" (straight line through space).
+        connectivity (int): 6 → consecutive cells share a face;
+            26 → boundaries crossed at the same point (edges/corners) are
+            stepped together, so consecutive cells may touch diagonally.
+
+    Yields:
+        int: truncated UVoxIDs, from uv1's cell to uv2's cell, each cell
+        once and each consecutive pair adjacent.
+
+    Raises:
+        ValueError: on an unknown mode/connectivity, or antipodal endpoints
+        (the great circle through them is not unique).
+    """
+    if mode not in MODES:
+        raise ValueError(f"unknown mode {mode!r}, expected one of {MODES}")
+    if connectivity not in (6, 26):
+        raise ValueError("connectivity must be 6 or 26")
+
+    steps = field_steps(sig_chars)
+    lat_cells, lon_cells = cell_counts(sig_chars)
+    limits = (None, lat_cells - 1, lon_cells - 1)
+
+    def index(values) -> tuple[int, int, int]:
+        idx = []
+        for v, step, top in zip(values, steps, limits):
+            if not step:
+                idx.append(0)
+                continue
+            i = int(v // step)
+            if top is not None:
+                i = min(max(i, 0), top)
+            idx.append(i)
+        return tuple(idx)
+
+    def cell(idx) -> int:
+        r, lat, lon = (i * s if s else 0 for i, s in zip(idx, steps))
+        return (r << 128) | (lat << 64) | lon
+
+    fields1, fields2 = decode_uvoxid(uv1), decode_uvoxid(uv2)
+    path = _Path(fields1, fields2, mode)
+
+    def pole_lon(which: int) -> int:
+        """Longitude index of an endpoint's own cell."""
+        return index((0, 0, (fields1, fields2)[which][2] + 180_000_000))[2]
+    bounds = [(0.0, "start")] + path.splits() + [(1.0, "end")]
+    f_pole = next((f for f, kind in bounds if kind == "pole"), None)
+
+    # Out-and-back folding: `run` is the current straight run of steps along
+    # `run_axes`; run[0] has been yielded, the rest are held back while a
+    # turn could still walk back over them.
+    run, run_axes, holding = [], None, False
+
+    def emit(idx):
+        """Feed one cell index through the fold; returns cells now safe to yield."""
+        nonlocal run, run_axes, holding
+        if not run:
+            run = [idx]
+            return [idx]
+        axes = tuple(a for a in range(3) if idx[a] != run[-1][a])
+        if holding and axes == run_axes and len(run) >= 2 and idx == run[-2]:
+            run.pop()
+            return []
+        if axes != run_axes:
+            out = run[1:]
+            run, run_axes = [run[-1]], axes
+            holding = turn_ahead
+        else:
+            out = []
+        run.append(idx)
+        if holding:
+            return out
+        out += run[1:]
+        run = [idx]
+        return out
+
+    prev_end = None
+    for (fa, kind_a), (fb, kind_b) in zip(bounds, bounds[1:]):
+        lon_ref = path.lon_ref(fa, fb, f_pole)
+        turn_ahead = kind_b == "turn"
+        holding = holding or turn_ahead
+
+        def endpoint(f, kind):
+            if kind in ("start", "end"):
+                r, lat, lon = fields1 if kind == "start" else fields2
+                if path.at_pole[kind == "end"]:
+                    lon = lon_ref
+                return r, lat + 90_000_000, _wrap_lon(lon, lon_ref) + 180e6
+            r, lat_enc, lon_enc = path.fields(f, lon_ref)
+            if kind == "pole":
+                lat_enc = 180e6 if lat_enc > 90e6 else 0.0
+                lon_enc = lon_ref + 180e6   # the meridian this piece runs along
+            elif kind == "antimeridian":
+                lon_enc = 360e6 if lon_ref > 0 else 0.0
+            return r, lat_enc, lon_enc
+
+        start = index(endpoint(fa, kind_a))
+        end = index(endpoint(fb, kind_b))
+
+        entering = []
+        if prev_end is None:
+            # Starting on a pole: along the pole row from the encoded
+            # longitude to the meridian the path leaves on.
+            lon = pole_lon(0) if path.at_pole[0] else start[2]
+            entering = [(start[0], start[1], lon)]
+            entering += [(start[0], start[1], i) for i in _row_walk(lon, start[2], lon_cells)]
+        elif start != prev_end:
+            if kind_a == "pole" and steps[2]:
+                # Over the pole onto the rotated column, then along the
+                # pole row to the meridian the path actually leaves on.
+                half = lon_cells // 2
+                lon = min(((prev_end[2] + d) % lon_cells for d in (half, -half)),
+                          key=lambda p: len(_row_walk(p, start[2], lon_cells)))
+                entering = [(start[0], start[1], lon)]
+                entering += [(start[0], start[1], i) for i in _row_walk(lon, start[2], lon_cells)]
+            else:
+                entering = [start]
+
+        for idx in entering:
+            yield from map(cell, emit(idx))
+        for idx in _walk_piece(path, fa, fb, start, end, steps, connectivity):
+            yield from map(cell, emit(idx))
+        prev_end = end
+
+    if path.at_pole[1]:
+        # Ending on a pole: along the pole row to the encoded longitude.
+        for i in _row_walk(prev_end[2], pole_lon(1), lon_cells):
+            yield from map(cell, emit((prev_end[0], prev_end[1], i)))
+    yield from map(cell, run[1:])
+
+
+def rasterize_segments(segments: Iterable[tuple[int, int]], sig_chars: int,
+                       mode: str = "great_circle",
+                       connectivity: int = 6) -> Iterator[list[int]]:
+    """
+    Rasterize many (start, end) segments, yielding one cell list per segment.
+
+    Per-level cell sizes and counts come from the neighbour module's caches,
+    so they are computed once for the whole batch.
+    """
+    for uv1, uv2 in segments:
+        yield list(rasterize_path(uv1, uv2, sig_chars, mode, connectivity))
+
+
+# --- Example usage ---
+if __name__ == "__main__":
+    from ..core import encode_uvoxid
+
+    EARTH_RADIUS_UM = 6_371_000_000_000
+    a = encode_uvoxid(EARTH_RADIUS_UM, 0, 179_990_000)
+    b = encode_uvoxid(EARTH_RADIUS_UM, 100, -179_990_000)
+
+    cells = list(rasterize_path(a, b, 36))
+    print(f"{len(cells)} cells across the antimeridian")
@@ -0,0 +1,230 @@
+"""
+sqlite_store.py — SQLite storage for UVoxIDs using split 64-bit columns.
+
+SQLite integers are signed 64-bit, so a 192-bit UVoxID cannot be stored in a
+single column. Instead the three raw fields from the UVoxID layout
+[ r (64b) | lat (64b) | lon (64b) ] each get an INTEGER column, biased by
+2**63 so that signed column order matches unsigned field order. The
+composite primary key (r, lat, lon) then sorts rows exactly like the
+192-bit integers, which turns a tolerance prefix into a single primary-key
+range scan.
+
+Bounding boxes are a different shape: a surface box spans kilometres of
+radius, which the r-first primary key cannot narrow down. A secondary
+(lat, lon, r) index serves those queries as a latitude range scan with
+longitude and radius checked from the index entries themselves.
+"""
+
+import sqlite3
+from typing import Iterable, Iterator, Optional
+
+from .tolerance import TOTAL_BITS, BITS_PER_CHAR, truncate_to_tolerance
+
+FIELD_BITS = 64
+MASK64 = (1 << FIELD_BITS) - 1
+BIAS = 1 << 63
+
+COLUMNS = ("r", "lat", "lon")
+
+
+def _to_sql(field: int) -> int:
+    return field - BIAS
+
+
+def _from_sql(value: int) -> int:
+    return value + BIAS
+
+
+def split_uvoxid(uvoxid: int) -> tuple[int, int, int]:
+    """Split a UVoxID into its three SQL column values (biased signed ints)."""
+    return (
+        _to_sql((uvoxid >> 128) & MASK64),
+        _to_sql((uvoxid >> 64) & MASK64),
+        _to_sql(uvoxid & MASK64),
+    )
+
+
+def join_uvoxid(r: int, lat: int, lon: int) -> int:
+    """Inverse of `split_uvoxid`."""
+    return (_from_sql(r) << 128) | (_from_sql(lat) << 64) | _from_sql(lon)
+
+
+class UVoxIDTable:
+    """
+    A table of UVoxIDs in an SQLite database.
+
+    Args:
+        conn (sqlite3.Connection): open connection (":memory:" works fine).
+        table (str): table name; must be a plain identifier.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, table: str = "uvoxids"):
+        if not table.isidentifier():
+            raise ValueError(f"invalid table name: {table!r}")
+        self.conn = conn
+        self.table = table
+
+    @property
+    def bbox_index(self) -> str:
+        """Name of the secondary (lat, lon, r) index used by `query_bbox`."""
+        return f"{self.table}_lat_lon_r"
+
+    def create(self) -> None:
+        """Create the table and its bounding-box index (no-op if they exist)."""
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            "r INTEGER NOT NULL, lat INTEGER NOT NULL, lon INTEGER NOT NULL, "
+            "PRIMARY KEY (r, lat, lon)) WITHOUT ROWID"
+        )
+        self.conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {self.bbox_index} ON {self.table} (lat, lon, r)"
+        )
+        self.conn.commit()
+
+    def __len__(self) -> int:
+        return self.conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def __contains__(self, uvoxid: int) -> bool:
+        row = self.conn.execute(
+            f"SELECT 1 FROM {self.table} WHERE r = ? AND lat = ? AND lon = ?",
+            split_uvoxid(uvoxid),
+        ).fetchone()
+        return row is not None
+
+    def insert(self, uvoxid: int) -> None:
+        """Insert a single UVoxID (duplicates are ignored)."""
+        with self.conn:
+            self.conn.execute(
+                f"INSERT OR IGNORE INTO {self.table} (r, lat, lon) VALUES (?, ?, ?)",
+                split_uvoxid(uvoxid),
+            )
+
+    def bulk_load(self, uvoxids: Iterable[int], batch_size: int = 50_000) -> int:
+        """
+        Insert many UVoxIDs with `executemany` inside a single transaction.
+
+        Input is consumed in batches of `batch_size`, so generators of any
+        length can be loaded without materializing them. Duplicates are
+        ignored.
+
+        Returns:
+            int: number of rows actually inserted.
+        """
+        sql = f"INSERT OR IGNORE INTO {self.table} (r, lat, lon) VALUES (?, ?, ?)"
+        before = self.conn.total_changes
+        batch = []
+        with self.conn:
+            for uv in uvoxids:
+                batch.append(split_uvoxid(uv))
+                if len(batch) >= batch_size:
+                    self.conn.executemany(sql, batch)
+                    batch = []
+            if batch:
+                self.conn.executemany(sql, batch)
+        return self.conn.total_changes - before
+
+    def delete(self, uvoxid: int) -> bool:
+        """Delete one UVoxID. Returns True if a row was removed."""
+        with self.conn:
+            cur = self.conn.execute(
+                f"DELETE FROM {self.table} WHERE r = ? AND lat = ? AND lon = ?",
+                split_uvoxid(uvoxid),
+            )
+        return cur.rowcount > 0
+
+    def _select(self, where: str, params: list) -> Iterator[int]:
+        sql = f"SELECT r, lat, lon FROM {self.table}"
+        if where:
+            sql += f" WHERE {where}"
+        sql += " ORDER BY r, lat, lon"
+        for r, lat, lon in self.conn.execute(sql, params):
+            yield join_uvoxid(r, lat, lon)
+
+    def __iter__(self) -> Iterator[int]:
+        return self._select("", [])
+
+    def query_prefix(self, uvoxid: int, sig_chars: int) -> Iterator[int]:
+        """
+        All stored UVoxIDs that fall in the same tolerance cell as `uvoxid`.
+
+        The cell is a contiguous 192-bit range; fields fully covered by the
+        prefix become equality constraints and the field containing the cut
+        becomes a BETWEEN, so SQLite scans a single primary-key range.
+        """
+        prefix = truncate_to_tolerance(uvoxid, sig_chars)
+        keep_bits = sig_chars * BITS_PER_CHAR
+        lo = prefix
+        hi = prefix | ((1 << (TOTAL_BITS - keep_bits)) - 1)
+
+        clauses = []
+        params = []
+        for i, col in enumerate(COLUMNS):
+            shift = (2 - i) * FIELD_BITS
+            f_lo = (lo >> shift) & MASK64
+            f_hi = (hi >> shift) & MASK64
+            if f_lo == f_hi:
+                clauses.append(f"{col} = ?")
+                params.append(_to_sql(f_lo))
+                continue
+            if (f_lo, f_hi) != (0, MASK64):
+                clauses.append(f"{col} BETWEEN ? AND ?")
+                params += [_to_sql(f_lo), _to_sql(f_hi)]
+            break  # all lower fields are unconstrained
+
+        return self._select(" AND ".join(clauses), params)
+
+    def query_bbox(self, r_min_um: int, r_max_um: int,
+                   lat_min_microdeg: int, lat_max_microdeg: int,
+                   lon_min_microdeg: Optional[int] = None,
+                   lon_max_microdeg: Optional[int] = None) -> Iterator[int]:
+        """
+        All stored UVoxIDs inside a (r, lat, lon) box.
+
+        A longitude range with lon_min > lon_max wraps across ±180°.
+        Omitting both longitude bounds selects all longitudes.
+
+        The radius test is written as `+r` so that SQLite cannot serve it
+        from the r-first primary key. This leaves the (lat, lon, r) index as
+        the only usable access path: a range scan over the latitude band,
+        with longitude and radius tested on index entries. Tables created
+        before that index existed get it by calling `create()` again.
+        Results are still returned in UVoxID order.
+
+        Raises:
+            ValueError: if only one of the longitude bounds is given.
+        """
+        if (lon_min_microdeg is None) != (lon_max_microdeg is None):
+            raise ValueError("give both longitude bounds or neither")
+
+        clauses = ["lat BETWEEN ? AND ?", "+r BETWEEN ? AND ?"]
+        params = [
+            _to_sql(lat_min_microdeg + 90_000_000), _to_sql(lat_max_microdeg + 90_000_000),
+            _to_sql(r_min_um), _to_sql(r_max_um),
+        ]
+
+        if lon_min_microdeg is not None:
+            lo = _to_sql(lon_min_microdeg + 180_000_000)
+            hi = _to_sql(lon_max_microdeg + 180_000_000)
+            if lon_min_microdeg <= lon_max_microdeg:
+                clauses.append("lon BETWEEN ? AND ?")
+            else:
+                clauses.append("(lon >= ? OR lon <= ?)")
+            params += [lo, hi]
+
+        return self._select(" AND ".join(clauses), params)
+
+
+# --- Example usage ---
+if __name__ == "__main__":
+    from ..core import encode_uvoxid
+
+    EARTH_RADIUS_UM = 6_371_000_000_000
+    table = UVoxIDTable(sqlite3.connect(":memory:"))
+    table.create()
+    n = table.bulk_load(
+        encode_uvoxid(EARTH_RADIUS_UM, lat, lon)
+        for lat in range(0, 1000, 10) for lon in range(0, 1000, 10)
+    )
+    print("Loaded", n, "rows")
+    probe = encode_uvoxid(EARTH_RADIUS_UM, 500, 500)
+    print("In cell @ 30 chars:", sum(1 for _ in table.query_prefix(probe, 30)))
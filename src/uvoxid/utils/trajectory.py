@@ -0,0 +1,329 @@
+"""
+trajectory.py — time-indexed storage and interpolation for moving UVoxIDs.
+
+A Trajectory keeps its samples in columnar arrays (times, r, lat, lon)
+instead of a list of (timestamp, uvoxid) pairs, so lookups do a binary
+search over the time column and never decode every sample.
+
+Times are POSIX seconds (float); `datetime` objects are accepted anywhere a
+time is expected and converted with `.timestamp()`.
+"""
+
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Hashable, Iterable, Optional, Union
+
+from uvoxid.core import encode_uvoxid, decode_uvoxid
+
+TimeLike = Union[float, int, datetime]
+
+# Below this central angle (radians) slerp is numerically useless and we
+# fall back to linear lat/lon interpolation.
+_SLERP_MIN_ANGLE = 1e-12
+
+
+def _to_seconds(t: TimeLike) -> float:
+    return t.timestamp() if isinstance(t, datetime) else float(t)
+
+
+def _wrap_dlon_microdeg(dlon: int) -> int:
+    """Normalize a longitude delta into [-180, 180] degrees (as in `spherical_delta`)."""
+    if dlon > 180_000_000:
+        dlon -= 360_000_000
+    elif dlon < -180_000_000:
+        dlon += 360_000_000
+    return dlon
+
+
+def _normalize_lon_microdeg(lon: int) -> int:
+    """Bring a longitude back into [-180, 180) degrees."""
+    return (lon + 180_000_000) % 360_000_000 - 180_000_000
+
+
+def _interpolate_fields(r1: int, lat1: int, lon1: int,
+                        r2: int, lat2: int, lon2: int,
+                        f: float) -> tuple[int, int, int]:
+    r = round(r1 + (r2 - r1) * f)
+
+    phi1, lam1 = math.radians(lat1 / 1e6), math.radians(lon1 / 1e6)
+    phi2, lam2 = math.radians(lat2 / 1e6), math.radians(lon2 / 1e6)
+
+    x1, y1, z1 = math.cos(phi1) * math.cos(lam1), math.cos(phi1) * math.sin(lam1), math.sin(phi1)
+    x2, y2, z2 = math.cos(phi2) * math.cos(lam2), math.cos(phi2) * math.sin(lam2), math.sin(phi2)
+
+    dot = max(-1.0, min(1.0, x1 * x2 + y1 * y2 + z1 * z2))
+    omega = math.acos(dot)
+
+    if omega < _SLERP_MIN_ANGLE or math.pi - omega < _SLERP_MIN_ANGLE:
+        # Coincident (or antipodal, where the great circle is undefined):
+        # interpolate lat and the wrapped longitude delta linearly.
+        lat = round(lat1 + (lat2 - lat1) * f)
+        lon = round(lon1 + _wrap_dlon_microdeg(lon2 - lon1) * f)
+        return r, lat, _normalize_lon_microdeg(lon)
+
+    sin_omega = math.sin(omega)
+    a = math.sin((1 - f) * omega) / sin_omega
+    b = math.sin(f * omega) / sin_omega
+    x, y, z = a * x1 + b * x2, a * y1 + b * y2, a * z1 + b * z2
+
+    lat = round(math.degrees(math.atan2(z, math.hypot(x, y))) * 1e6)
+    lon = round(math.degrees(math.atan2(y, x)) * 1e6)
+    return r, lat, _normalize_lon_microdeg(lon)
+
+
+def interpolate_uvoxid(uv1: int, uv2: int, f: float) -> int:
+    """
+    Interpolate between two UVoxIDs.
+
+    The angular position follows the great circle between the two points
+    (so longitude wrap at ±180° is handled naturally) and the radius is
+    interpolated linearly.
+
+    Args:
+        uv1 (int): start UVoxID.
+        uv2 (int): end UVoxID.
+        f (float): fraction along the path, 0.0 → uv1, 1.0 → uv2.
+
+    Returns:
+        int: interpolated UVoxID.
+    """
+    r1, lat1, lon1 = decode_uvoxid(uv1)
+    r2, lat2, lon2 = decode_uvoxid(uv2)
+    return encode_uvoxid(*_interpolate_fields(r1, lat1, lon1, r2, lat2, lon2, f))
+
+
+class Trajectory:
+    """
+    Append-only, time-ordered track of a single moving object.
+
+    Columns:
+      - times: POSIX seconds (array of float)
+      - r: radius in µm (array of unsigned 64-bit)
+      - lat / lon: microdegrees (arrays of signed 64-bit)
+    """
+
+    __slots__ = ("times", "r", "lat", "lon")
+
+    def __init__(self, samples: Optional[Iterable[tuple[TimeLike, int]]] = None):
+        self.times = array("d")
+        self.r = array("Q")
+        self.lat = array("q")
+        self.lon = array("q")
+        if samples is not None:
+            self.extend(samples)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __repr__(self) -> str:
+        if not self.times:
+            return "Trajectory(empty)"
+        return f"Trajectory({len(self)} samples, t=[{self.times[0]}, {self.times[-1]}])"
+
+    @property
+    def start_time(self) -> float:
+        return self.times[0]
+
+    @property
+    def end_time(self) -> float:
+        return self.times[-1]
+
+    def append(self, t: TimeLike, uvoxid: int) -> None:
+        """
+        Append a sample. Timestamps must be non-decreasing.
+
+        Raises:
+            ValueError: if `t` is earlier than the last stored sample.
+        """
+        t = _to_seconds(t)
+        if self.times and t < self.times[-1]:
+            raise ValueError(f"out-of-order sample: {t} < {self.times[-1]}")
+        r, lat, lon = decode_uvoxid(uvoxid)
+        self.times.append(t)
+        self.r.append(r)
+        self.lat.append(lat)
+        self.lon.append(lon)
+
+    def extend(self, samples: Iterable[tuple[TimeLike, int]]) -> None:
+        """Append many (time, uvoxid) samples in order."""
+        for t, uv in samples:
+            self.append(t, uv)
+
+    def sample(self, i: int) -> tuple[float, int]:
+        """Return the i-th stored sample as (time, uvoxid)."""
+        return self.times[i], encode_uvoxid(self.r[i], self.lat[i], self.lon[i])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.sample(i)
+
+    def _position(self, t: float, i: int) -> int:
+        # i = bisect_right(times, t), so times[i - 1] <= t; range already checked.
+        j = i - 1
+        if self.times[j] == t or j == len(self.times) - 1:
+            return encode_uvoxid(self.r[j], self.lat[j], self.lon[j])
+
+        t0, t1 = self.times[j], self.times[i]
+        f = (t - t0) / (t1 - t0)
+        return encode_uvoxid(*_interpolate_fields(
+            self.r[j], self.lat[j], self.lon[j],
+            self.r[i], self.lat[i], self.lon[i],
+            f,
+        ))
+
+    def covers(self, t: TimeLike) -> bool:
+        """True if `t` lies within [start_time, end_time]."""
+        t = _to_seconds(t)
+        return bool(self.times) and self.times[0] <= t <= self.times[-1]
+
+    def position_at(self, t: TimeLike) -> int:
+        """
+        Interpolated position at time `t`.
+
+        Raises:
+            ValueError: if `t` is outside the recorded time range.
+        """
+        t = _to_seconds(t)
+        if not self.covers(t):
+            raise ValueError(f"time {t} outside trajectory range")
+        return self._position(t, bisect_right(self.times, t))
+
+    def positions_at(self, times: Iterable[TimeLike]) -> list[int]:
+        """
+        Interpolated positions for many times.
+
+        Sorted inputs are resolved with a single forward walk; unsorted
+        inputs fall back to a binary search per time.
+        """
+        ts = [_to_seconds(t) for t in times]
+        if not ts:
+            return []
+        if not self.times or min(ts) < self.times[0] or max(ts) > self.times[-1]:
+            raise ValueError("requested times outside trajectory range")
+
+        out = []
+        n = len(self.times)
+        i = 0
+        prev = -math.inf
+        for t in ts:
+            if t < prev:
+                i = bisect_right(self.times, t)
+            else:
+                while i < n and self.times[i] <= t:
+                    i += 1
+            out.append(self._position(t, i))
+            prev = t
+        return out
+
+    def window(self, t_start: TimeLike, t_end: TimeLike) -> "Trajectory":
+        """Return the samples with t_start <= t <= t_end as a new Trajectory."""
+        lo = bisect_left(self.times, _to_seconds(t_start))
+        hi = bisect_right(self.times, _to_seconds(t_end))
+        out = Trajectory()
+        out.times = self.times[lo:hi]
+        out.r = self.r[lo:hi]
+        out.lat = self.lat[lo:hi]
+        out.lon = self.lon[lo:hi]
+        return out
+
+    def downsample(self, window_s: float) -> "Trajectory":
+        """
+        Keep the first sample of every `window_s`-second window (plus the
+        final sample, so the track end is preserved).
+        """
+        if window_s <= 0:
+            raise ValueError("window_s must be positive")
+
+        out = Trajectory()
+        if not self.times:
+            return out
+
+        t0 = self.times[0]
+        last_bucket = None
+        last_kept = -1
+        for i, t in enumerate(self.times):
+            bucket = int((t - t0) // window_s)
+            if bucket != last_bucket:
+                last_bucket = bucket
+                last_kept = i
+                out.times.append(t)
+                out.r.append(self.r[i])
+                out.lat.append(self.lat[i])
+                out.lon.append(self.lon[i])
+
+        end = len(self.times) - 1
+        if last_kept != end:
+            out.times.append(self.times[end])
+            out.r.append(self.r[end])
+            out.lat.append(self.lat[end])
+            out.lon.append(self.lon[end])
+        return out
+
+
+class TrajectoryStore:
+    """
+    Collection of trajectories keyed by track ID, with batch queries.
+    """
+
+    def __init__(self):
+        self.tracks: dict[Hashable, Trajectory] = {}
+
+    def __len__(self) -> int:
+        return len(self.tracks)
+
+    def __contains__(self, track_id: Hashable) -> bool:
+        return track_id in self.tracks
+
+    def __getitem__(self, track_id: Hashable) -> Trajectory:
+        return self.tracks[track_id]
+
+    def append(self, track_id: Hashable, t: TimeLike, uvoxid: int) -> None:
+        """Append one sample to a track, creating the track if needed."""
+        track = self.tracks.get(track_id)
+        if track is None:
+            track = self.tracks[track_id] = Trajectory()
+        track.append(t, uvoxid)
+
+    def ingest(self, samples: Iterable[tuple[Hashable, TimeLike, int]]) -> None:
+        """Append many (track_id, time, uvoxid) samples."""
+        for track_id, t, uv in samples:
+            self.append(track_id, t, uv)
+
+    def positions_at(self, t: TimeLike,
+                     track_ids: Optional[Iterable[Hashable]] = None) -> dict:
+        """
+        Position of every track (or of `track_ids`) at time `t`.
+
+        Tracks whose time range does not cover `t` are left out.
+
+        Returns:
+            dict mapping track_id → interpolated UVoxID.
+        """
+        t = _to_seconds(t)
+        ids = self.tracks.keys() if track_ids is None else track_ids
+        out = {}
+        for track_id in ids:
+            track = self.tracks[track_id]
+            if track.covers(t):
+                out[track_id] = track._position(t, bisect_right(track.times, t))
+        return out
+
+    def downsample(self, window_s: float) -> "TrajectoryStore":
+        """Downsample every track (see `Trajectory.downsample`)."""
+        out = TrajectoryStore()
+        out.tracks = {tid: tr.downsample(window_s) for tid, tr in self.tracks.items()}
+        return out
+
+
+# --- Example usage ---
+if __name__ == "__main__":
+    EARTH_RADIUS_UM = 6_371_000_000_000
+
+    track = Trajectory([
+        (0.0, encode_uvoxid(EARTH_RADIUS_UM, 0, 179_000_000)),
+        (60.0, encode_uvoxid(EARTH_RADIUS_UM, 0, -179_000_000)),
+    ])
+    r, lat, lon = decode_uvoxid(track.position_at(30.0))
+    print(f"Midpoint across the antimeridian: lat={lat/1e6}°, lon={lon/1e6}°")
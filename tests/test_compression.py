@@ -0,0 +1,67 @@
+import io
+import pytest
+
+from uvoxid.core import encode_uvoxid
+from uvoxid.formats import uvoxid_to_bin
+from uvoxid.utils.compression import (
+    zigzag_encode,
+    zigzag_decode,
+    compress_uvoxids,
+    decompress_uvoxids,
+    iter_encode,
+    iter_decompress,
+    uvoxid_at,
+    compression_stats,
+)
+
+EARTH_RADIUS_UM = 6_371_000_000_000
+
+
+@pytest.fixture
+def sorted_voxels():
+    """A sorted, highly redundant voxel set near Miami."""
+    return sorted(
+        encode_uvoxid(EARTH_RADIUS_UM + dr, int(25.76 * 1e6) + i, int(-80.19 * 1e6) - i)
+        for dr in range(5) for i in range(300)
+    )
+
+
+def test_zigzag_roundtrip():
+    for n in (0, -1, 1, -2, 2, -(1 << 64), (1 << 64) - 1):
+        assert zigzag_decode(zigzag_encode(n)) == n
+    assert [zigzag_encode(n) for n in (0, -1, 1, -2)] == [0, 1, 2, 3]
+
+
+def test_roundtrip(sorted_voxels):
+    packed = compress_uvoxids(sorted_voxels, block_size=100, restart_interval=8)
+    assert decompress_uvoxids(packed) == sorted_voxels
+
+
+def test_roundtrip_extreme_fields():
+    ids = [0, (1 << 192) - 1, 1, (1 << 191), 12345]
+    assert decompress_uvoxids(compress_uvoxids(ids, restart_interval=2)) == ids
+
+
+def test_streaming_from_file(sorted_voxels):
+    fp = io.BytesIO()
+    for block in iter_encode(iter(sorted_voxels), block_size=64):
+        fp.write(block)
+    fp.seek(0)
+    assert list(iter_decompress(fp)) == sorted_voxels
+
+
+def test_random_access(sorted_voxels):
+    packed = compress_uvoxids(sorted_voxels, block_size=100, restart_interval=7)
+    for i in (0, 6, 7, 99, 100, 733, len(sorted_voxels) - 1):
+        assert uvoxid_at(packed, i) == sorted_voxels[i]
+    with pytest.raises(IndexError):
+        uvoxid_at(packed, len(sorted_voxels))
+
+
+def test_compression_stats(sorted_voxels):
+    packed = compress_uvoxids(sorted_voxels)
+    stats = compression_stats(packed)
+    assert stats["count"] == len(sorted_voxels)
+    assert stats["raw_bytes"] == len(sorted_voxels) * len(uvoxid_to_bin(sorted_voxels[0]))
+    assert stats["compressed_bytes"] == len(packed)
+    assert stats["ratio"] > 4
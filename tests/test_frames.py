@@ -0,0 +1,56 @@
+import math
+import pytest
+from datetime import datetime, timezone
+
+from uvoxid.core import encode_uvoxid, decode_uvoxid
+from extras.ephemeris import moon_barycenter_uvoxid, AU_UM
+from extras.frames import (
+    transform_uvoxids,
+    transform_uvoxid,
+    frame_translation_um,
+    roundtrip_error_um,
+)
+
+EARTH_RADIUS_UM = 6_371_000_000_000
+WHEN = datetime(2025, 3, 20, 12, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def voxels():
+    return [encode_uvoxid(EARTH_RADIUS_UM, lat * 1_000_000, lon * 1_000_000)
+            for lat in (-60, 0, 60) for lon in (-120, 0, 120)]
+
+
+def test_identity_frame(voxels):
+    assert transform_uvoxids(voxels, "earth", "earth", WHEN) == voxels
+
+
+def test_moon_centre_maps_to_origin():
+    moon = moon_barycenter_uvoxid(WHEN)
+    r_um, _, _ = decode_uvoxid(transform_uvoxid(moon, "earth", "moon", WHEN))
+    assert r_um < 1_000_000  # within a metre of the Moon's centre
+
+
+def test_sun_frame_distance(voxels):
+    for uv in transform_uvoxids(voxels, "earth", "sun", WHEN):
+        r_um, _, _ = decode_uvoxid(uv)
+        assert abs(r_um - AU_UM) <= EARTH_RADIUS_UM
+
+
+def test_translation_is_cached():
+    frame_translation_um.cache_clear()
+    frame_translation_um("earth", "moon", WHEN)
+    frame_translation_um("earth", "moon", WHEN)
+    assert frame_translation_um.cache_info().hits == 1
+
+
+def test_roundtrip_error_reported(voxels):
+    err = roundtrip_error_um(voxels, "earth", "sun", WHEN)
+    assert err["count"] == len(voxels)
+    # Bounded by one microdegree of arc at 1 AU
+    assert 0 <= err["mean_um"] <= err["max_um"] < AU_UM * math.radians(1e-6) * 2
+
+
+def test_unknown_body(voxels):
+    with pytest.raises(ValueError):
+        transform_uvoxids(voxels, "earth", "mars", WHEN)
@@ -0,0 +1,58 @@
+import random
+import pytest
+
+from uvoxid.core import encode_uvoxid
+from uvoxid.utils.distance import linear_distance, cartesian_m
+from uvoxid.utils.join import spatial_join, spatial_join_parallel
+
+EARTH_RADIUS_UM = 6_371_000_000_000
+THRESHOLD_M = 25.0
+
+
+def _random_voxels(rng, n):
+    # ~0.01° square near the antimeridian (roughly 1 km across)
+    return [
+        encode_uvoxid(EARTH_RADIUS_UM + rng.randrange(0, 20_000_000),
+                      rng.randrange(0, 10_000), 179_995_000 + rng.randrange(0, 4_999))
+        for _ in range(n)
+    ]
+
+
+@pytest.fixture
+def sides():
+    rng = random.Random(7)
+    return _random_voxels(rng, 300), _random_voxels(rng, 200)
+
+
+def brute_force(left, right):
+    return {(a, b) for a in left for b in right if linear_distance(a, b) <= THRESHOLD_M}
+
+
+def test_cartesian_matches_linear_distance(sides):
+    a, b = sides[0][0], sides[1][0]
+    ax, ay, az = cartesian_m(a)
+    bx, by, bz = cartesian_m(b)
+    chord = ((ax - bx) ** 2 + (ay - by) ** 2 + (az - bz) ** 2) ** 0.5
+    assert chord == pytest.approx(linear_distance(a, b), abs=0.05)
+
+
+def test_spatial_join_matches_brute_force(sides):
+    left, right = sides
+    pairs = list(spatial_join(left, right, THRESHOLD_M))
+    assert {(a, b) for a, b, _ in pairs} == brute_force(left, right)
+    assert len(pairs) == len({(a, b) for a, b, _ in pairs})
+    for a, b, d in pairs:
+        # linear_distance loses ~mm to cancellation at Earth radius
+        assert d == pytest.approx(linear_distance(a, b), abs=0.05)
+
+
+def test_spatial_join_parallel_matches_serial(sides):
+    left, right = sides
+    serial = sorted(spatial_join(left, right, THRESHOLD_M))
+    parallel = sorted(spatial_join_parallel(left, right, THRESHOLD_M, partitions=5, max_workers=2))
+    assert parallel == serial
+
+
+def test_invalid_threshold(sides):
+    with pytest.raises(ValueError):
+        list(spatial_join(*sides, threshold_m=0))
@@ -0,0 +1,93 @@
+import pytest
+
+from uvoxid.core import encode_uvoxid, decode_uvoxid
+from uvoxid.utils.tolerance import truncate_to_tolerance
+from uvoxid.utils.neighbors import (
+    field_steps,
+    neighbor_offsets,
+    voxel_neighbors,
+    batch_neighbors,
+)
+
+EARTH_RADIUS_UM = 6_371_000_000_000
+SIG = 36  # r and lat at full precision, lon in 4096 µdeg cells
+
+
+def test_field_steps():
+    assert field_steps(SIG) == (1, 1, 1 << 12)
+    # Only part of r survives: lat/lon collapse entirely
+    assert field_steps(6) == (1 << 34, None, None)
+    with pytest.raises(ValueError):
+        field_steps(40)
+
+
+def test_offsets_are_cached_and_sized():
+    assert len(neighbor_offsets(SIG, 6)) == 6
+    assert len(neighbor_offsets(SIG, 26)) == 26
+    assert neighbor_offsets(SIG, 6) is neighbor_offsets(SIG, 6)
+
+
+def test_six_neighbors_equator():
+    uv = encode_uvoxid(EARTH_RADIUS_UM, 10_000_000, 20_000_000)
+    ns = voxel_neighbors(uv, SIG)
+    assert len(ns) == 6
+    assert truncate_to_tolerance(uv, SIG) not in ns
+    assert ns == sorted(set(ns))
+
+
+def test_26_neighbors_equator():
+    uv = encode_uvoxid(EARTH_RADIUS_UM, 10_000_000, 20_000_000)
+    assert len(voxel_neighbors(uv, SIG, connectivity=26)) == 26
+
+
+def test_longitude_wrap():
+    uv = encode_uvoxid(EARTH_RADIUS_UM, 0, 179_999_999)
+    lons = {decode_uvoxid(n)[2] for n in voxel_neighbors(uv, SIG)}
+    # Stepping east from the last cell lands at -180°
+    assert -180_000_000 in lons
+
+
+def test_pole_reflection():
+    uv = encode_uvoxid(EARTH_RADIUS_UM, 90_000_000, 0)
+    for n in voxel_neighbors(uv, SIG, connectivity=26):
+        _, lat, lon = decode_uvoxid(n)
+        assert -90_000_000 <= lat <= 90_000_000
+        assert -180_000_000 <= lon < 180_000_000
+
+
+def test_radius_does_not_go_negative():
+    uv = encode_uvoxid(0, 0, 0)
+    assert all(decode_uvoxid(n)[0] >= 0 for n in voxel_neighbors(uv, SIG, 26))
+
+
+def test_batch_neighbors_dedup():
+    a = encode_uvoxid(EARTH_RADIUS_UM, 0, 0)
+    b = encode_uvoxid(EARTH_RADIUS_UM, 1, 0)  # adjacent in latitude
+    frontier = batch_neighbors([a, b, a], SIG)
+    assert len(frontier) == len(set(frontier)) == 10
+    assert truncate_to_tolerance(a, SIG) not in frontier
+    with_sources = batch_neighbors([a, b], SIG, include_sources=True)
+    assert truncate_to_tolerance(a, SIG) in with_sources
+
+
+@pytest.mark.parametrize("sig", [34, 35])
+def test_longitude_wrap_partial_last_cell(sig):
+    # 360e6 is not a multiple of the lon cell size here, so the last cell
+    # before +180° is partial and must still be the west neighbour of -180°.
+    west_edge = encode_uvoxid(EARTH_RADIUS_UM, 0, -180_000_000)
+    last_cell = truncate_to_tolerance(encode_uvoxid(EARTH_RADIUS_UM, 0, 179_999_999), sig)
+    assert last_cell in voxel_neighbors(west_edge, sig)
+    assert truncate_to_tolerance(west_edge, sig) in voxel_neighbors(last_cell, sig)
+
+
+@pytest.mark.parametrize("sig", [34, 35, 36])
+@pytest.mark.parametrize("lat", [-90_000_000, 90_000_000])
+def test_pole_adjacency_is_symmetric(sig, lat):
+    for lon in range(-180_000_000, 180_000_000, 7_777_777):
+        cell = truncate_to_tolerance(encode_uvoxid(EARTH_RADIUS_UM, lat, lon), sig)
+        for n in voxel_neighbors(cell, sig, connectivity=26):
+            assert cell in voxel_neighbors(n, sig, connectivity=26)
+    # The example from the -90° row at 34 chars, in both directions
+    a = truncate_to_tolerance(encode_uvoxid(EARTH_RADIUS_UM, lat, 176_515_840 - 180_000_000), sig)
+    for b in voxel_neighbors(a, sig):
+        assert a in voxel_neighbors(b, sig)
@@ -0,0 +1,85 @@
+import random
+import pytest
+
+from uvoxid.core import encode_uvoxid
+from uvoxid.utils.tolerance import truncate_to_tolerance
+from uvoxid.utils.pyramid import AggregationPyramid
+
+EARTH_RADIUS_UM = 6_371_000_000_000
+LEVELS = (28, 31, 34, 37)
+
+
+@pytest.fixture
+def items():
+    rng = random.Random(42)
+    return [
+        (encode_uvoxid(EARTH_RADIUS_UM, rng.randrange(0, 5_000_000), rng.randrange(0, 50_000_000)),
+         rng.randrange(-100, 100))
+        for _ in range(500)
+    ]
+
+
+def brute_force(items, level, reduce):
+    groups = {}
+    for uv, v in items:
+        groups.setdefault(truncate_to_tolerance(uv, level), []).append(v)
+    return {k: reduce(vs) for k, vs in groups.items()}
+
+
+@pytest.mark.parametrize("name,reduce", [("count", len), ("sum", sum), ("min", min), ("max", max)])
+def test_build_matches_brute_force(items, name, reduce):
+    pyramid = AggregationPyramid(LEVELS, reducer=name)
+    pyramid.build(items)
+    for level in LEVELS:
+        assert pyramid.cells(level) == brute_force(items, level, reduce)
+
+
+def test_incremental_insert_remove(items):
+    pyramid = AggregationPyramid(LEVELS, reducer="max")
+    for uv, v in items:
+        pyramid.insert(uv, v)
+    removed, kept = items[:200], items[200:]
+    for uv, v in removed:
+        pyramid.remove(uv, v)
+    assert len(pyramid) == len(kept)
+    for level in LEVELS:
+        assert pyramid.cells(level) == brute_force(kept, level, max)
+
+
+def test_remove_missing_raises():
+    pyramid = AggregationPyramid(LEVELS)
+    with pytest.raises(KeyError):
+        pyramid.remove(encode_uvoxid(EARTH_RADIUS_UM, 0, 0))
+
+
+@pytest.mark.parametrize("reducer", ["min", "max"])
+def test_remove_wrong_value_raises_and_keeps_state(reducer):
+    pyramid = AggregationPyramid(LEVELS, reducer=reducer)
+    uv = encode_uvoxid(EARTH_RADIUS_UM, 0, 0)
+    pyramid.insert(uv, 5)
+    with pytest.raises(KeyError):
+        pyramid.remove(uv, 7)
+    for level in LEVELS:
+        assert pyramid.count(uv, level) == 1
+        assert pyramid.value(uv, level) == 5
+
+
+@pytest.mark.parametrize("prefix_sig", [26, 28, 30, 31, 34])
+def test_cells_within_prefix(items, prefix_sig):
+    pyramid = AggregationPyramid(LEVELS, reducer="sum")
+    pyramid.build(items)
+    probe = items[0][0]
+    region = truncate_to_tolerance(probe, prefix_sig)
+    for level in (lvl for lvl in LEVELS if lvl >= prefix_sig):
+        expected = {k: v for k, v in brute_force(items, level, sum).items()
+                    if truncate_to_tolerance(k, prefix_sig) == region}
+        assert pyramid.cells(level, probe, prefix_sig) == expected
+
+
+def test_point_queries(items):
+    pyramid = AggregationPyramid(LEVELS)
+    pyramid.build(uv for uv, _ in items)
+    uv = items[0][0]
+    assert pyramid.count(uv, 28) == pyramid.value(uv, 28) >= 1
+    with pytest.raises(ValueError):
+        pyramid.value(uv, 29)
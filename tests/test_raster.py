@@ -0,0 +1,94 @@
+import pytest
+
+from uvoxid.core import encode_uvoxid, decode_uvoxid
+from uvoxid.utils.tolerance import truncate_to_tolerance
+from uvoxid.utils.neighbors import voxel_neighbors
+from uvoxid.utils.raster import rasterize_path, rasterize_segments
+
+EARTH_RADIUS_UM = 6_371_000_000_000
+
+
+def assert_connected(cells, sig, connectivity):
+    assert len(cells) == len(set(cells))
+    for a, b in zip(cells, cells[1:]):
+        assert b in voxel_neighbors(a, sig, connectivity)
+
+
+def test_endpoints_and_connectivity():
+    a = encode_uvoxid(EARTH_RADIUS_UM, 0, 0)
+    b = encode_uvoxid(EARTH_RADIUS_UM + 30, 40, 50_000)
+    cells = list(rasterize_path(a, b, 36))
+    assert cells[0] == truncate_to_tolerance(a, 36)
+    assert cells[-1] == truncate_to_tolerance(b, 36)
+    assert_connected(cells, 36, 6)
+
+
+def test_26_connectivity_is_shorter():
+    a = encode_uvoxid(EARTH_RADIUS_UM, 0, 0)
+    b = encode_uvoxid(EARTH_RADIUS_UM + 30, 40, 50_000)
+    six = list(rasterize_path(a, b, 36, connectivity=6))
+    twenty_six = list(rasterize_path(a, b, 36, connectivity=26))
+    assert len(twenty_six) <= len(six)
+    assert_connected(twenty_six, 36, 26)
+
+
+def test_longitude_wrap():
+    a = encode_uvoxid(EARTH_RADIUS_UM, 0, 179_990_000)
+    b = encode_uvoxid(EARTH_RADIUS_UM, 0, -179_990_000)
+    cells = list(rasterize_path(a, b, 36))
+    assert_connected(cells, 36, 6)
+    # Short way round: ~20000 µdeg in 4096 µdeg cells
+    assert len(cells) <= 7
+
+
+def test_pole_crossing():
+    # Longitudes on cell boundaries, so the cell across the pole is the one
+    # voxel_neighbors reports (2**22 µdeg cells at 34 chars)
+    lon = 20 * (1 << 22) - 180_000_000
+    a = encode_uvoxid(EARTH_RADIUS_UM, 85_000_000, lon)
+    b = encode_uvoxid(EARTH_RADIUS_UM, 85_000_000, lon + 180_000_000)
+    cells = list(rasterize_path(a, b, 34))
+    assert cells[0] == truncate_to_tolerance(a, 34)
+    assert cells[-1] == truncate_to_tolerance(b, 34)
+    assert_connected(cells, 34, 6)
+    top = max(decode_uvoxid(c)[1] for c in cells)
+    assert top > 89_000_000
+    # Both sides of the pole are visited in the top row
+    assert len({decode_uvoxid(c)[2] for c in cells if decode_uvoxid(c)[1] == top}) == 2
+
+
+def test_antipodal_endpoints_rejected():
+    a = encode_uvoxid(EARTH_RADIUS_UM, 0, 0)
+    b = encode_uvoxid(EARTH_RADIUS_UM, 0, 180_000_000 - 360_000_000)
+    with pytest.raises(ValueError):
+        list(rasterize_path(a, b, 34))
+
+
+def test_chord_mode_dips_below_surface():
+    # Six 256 µdeg latitude cells apart (~170 m) at 24 chars: the chord sags
+    # ~570 µm below the surface and comes back up (r cells are 1 µm)
+    a = encode_uvoxid(EARTH_RADIUS_UM, 0, 0)
+    b = encode_uvoxid(EARTH_RADIUS_UM, 6 * 256, 0)
+    cells = list(rasterize_path(a, b, 24, mode="chord"))
+    assert cells[0] == truncate_to_tolerance(a, 24)
+    assert cells[-1] == truncate_to_tolerance(b, 24)
+    assert_connected(cells, 24, 6)
+    depth = EARTH_RADIUS_UM - min(decode_uvoxid(c)[0] for c in cells)
+    assert 500 < depth < 650
+
+    arc = list(rasterize_path(a, b, 24))
+    assert {decode_uvoxid(c)[0] for c in arc} == {EARTH_RADIUS_UM}
+    assert len(arc) == 7
+
+
+def test_same_cell_and_batch():
+    a = encode_uvoxid(EARTH_RADIUS_UM, 0, 0)
+    assert list(rasterize_path(a, a, 36)) == [truncate_to_tolerance(a, 36)]
+    b = encode_uvoxid(EARTH_RADIUS_UM, 5, 0)
+    batches = list(rasterize_segments([(a, b), (b, a)], 36))
+    assert batches[0] == list(reversed(batches[1]))
+
+
+def test_invalid_mode():
+    with pytest.raises(ValueError):
+        list(rasterize_path(0, 0, 36, mode="rhumb"))
@@ -0,0 +1,95 @@
+import sqlite3
+import pytest
+
+from uvoxid.core import encode_uvoxid
+from uvoxid.utils.tolerance import equal_within_tolerance
+from uvoxid.utils.sqlite_store import UVoxIDTable, split_uvoxid, join_uvoxid
+
+EARTH_RADIUS_UM = 6_371_000_000_000
+
+
+@pytest.fixture
+def table():
+    t = UVoxIDTable(sqlite3.connect(":memory:"))
+    t.create()
+    return t
+
+
+@pytest.fixture
+def grid():
+    return [
+        encode_uvoxid(EARTH_RADIUS_UM + dr, lat, lon)
+        for dr in (0, 10)
+        for lat in range(-50_000, 50_000, 5_000)
+        for lon in (-179_990_000, -10_000, 0, 10_000, 179_990_000)
+    ]
+
+
+def test_split_join_roundtrip():
+    for uv in (0, (1 << 192) - 1, encode_uvoxid(EARTH_RADIUS_UM, -1, -1)):
+        parts = split_uvoxid(uv)
+        assert all(-(1 << 63) <= p < (1 << 63) for p in parts)
+        assert join_uvoxid(*parts) == uv
+
+
+def test_bulk_load_and_order(table, grid):
+    assert table.bulk_load(reversed(grid), batch_size=7) == len(grid)
+    assert table.bulk_load(grid) == 0  # duplicates ignored
+    assert len(table) == len(grid)
+    assert list(table) == sorted(grid)
+    assert grid[3] in table
+
+
+def test_query_prefix_matches_tolerance(table, grid):
+    table.bulk_load(grid)
+    probe = grid[17]
+    for sig in (10, 20, 27, 30, 38):
+        expected = sorted(uv for uv in grid if equal_within_tolerance(uv, probe, sig))
+        assert list(table.query_prefix(probe, sig)) == expected
+
+
+def test_query_bbox_with_wrap(table, grid):
+    table.bulk_load(grid)
+    hits = list(table.query_bbox(EARTH_RADIUS_UM, EARTH_RADIUS_UM, -10_000, 10_000,
+                                 179_000_000, -179_000_000))
+    assert len(hits) == 5 * 2  # 5 latitudes x 2 longitudes across the antimeridian
+    plain = list(table.query_bbox(EARTH_RADIUS_UM, EARTH_RADIUS_UM + 10, -10_000, 10_000,
+                                  -10_000, 10_000))
+    assert len(plain) == 2 * 5 * 3
+
+
+def test_delete(table, grid):
+    table.bulk_load(grid)
+    assert table.delete(grid[0])
+    assert not table.delete(grid[0])
+    assert grid[0] not in table
+
+
+def test_query_bbox_uses_lat_index(table, grid):
+    table.bulk_load(grid)
+    statements = []
+    table.conn.set_trace_callback(statements.append)
+    list(table.query_bbox(EARTH_RADIUS_UM, EARTH_RADIUS_UM + 10, -10_000, 10_000,
+                          179_000_000, -179_000_000))
+    table.conn.set_trace_callback(None)
+
+    plan = table.conn.execute("EXPLAIN QUERY PLAN " + statements[-1]).fetchall()
+    detail = " ".join(row[-1] for row in plan)
+    assert f"INDEX {table.bbox_index} (lat>? AND lat<?)" in detail
+
+
+def test_query_bbox_needs_both_lon_bounds(table):
+    with pytest.raises(ValueError):
+        table.query_bbox(EARTH_RADIUS_UM, EARTH_RADIUS_UM, -10_000, 10_000, lon_min_microdeg=0)
+
+
+def test_query_bbox_on_table_without_index(grid):
+    conn = sqlite3.connect(":memory:")
+    t = UVoxIDTable(conn)
+    t.create()
+    conn.execute(f"DROP INDEX {t.bbox_index}")
+    t.bulk_load(grid)
+    hits = list(t.query_bbox(EARTH_RADIUS_UM, EARTH_RADIUS_UM, -10_000, 10_000, -10_000, 10_000))
+    assert len(hits) == 5 * 3
+    t.create()  # adds the missing index
+    assert list(t.query_bbox(EARTH_RADIUS_UM, EARTH_RADIUS_UM, -10_000, 10_000, -10_000, 10_000)) == hits
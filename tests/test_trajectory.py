@@ -0,0 +1,73 @@
+import pytest
+from datetime import datetime, timezone
+
+from uvoxid.core import encode_uvoxid, decode_uvoxid
+from uvoxid.utils.trajectory import Trajectory, TrajectoryStore, interpolate_uvoxid
+
+EARTH_RADIUS_UM = 6_371_000_000_000
+
+
+@pytest.fixture
+def eastbound():
+    """Object moving east along the equator, one degree per minute."""
+    return Trajectory(
+        (60.0 * i, encode_uvoxid(EARTH_RADIUS_UM + 1000 * i, 0, i * 1_000_000))
+        for i in range(10)
+    )
+
+
+def test_position_at_samples_and_midpoints(eastbound):
+    assert eastbound.position_at(120.0) == eastbound.sample(2)[1]
+    r, lat, lon = decode_uvoxid(eastbound.position_at(90.0))
+    assert r == EARTH_RADIUS_UM + 1500
+    assert lat == 0
+    assert lon == 1_500_000
+
+
+def test_position_at_out_of_range(eastbound):
+    with pytest.raises(ValueError):
+        eastbound.position_at(-1.0)
+    with pytest.raises(ValueError):
+        eastbound.position_at(10_000.0)
+
+
+def test_append_only():
+    track = Trajectory()
+    track.append(10.0, encode_uvoxid(EARTH_RADIUS_UM, 0, 0))
+    with pytest.raises(ValueError):
+        track.append(5.0, encode_uvoxid(EARTH_RADIUS_UM, 0, 0))
+
+
+def test_interpolation_wraps_longitude():
+    a = encode_uvoxid(EARTH_RADIUS_UM, 0, 179_000_000)
+    b = encode_uvoxid(EARTH_RADIUS_UM, 0, -179_000_000)
+    _, lat, lon = decode_uvoxid(interpolate_uvoxid(a, b, 0.25))
+    assert lat == 0
+    assert lon == 179_500_000
+
+
+def test_positions_at_matches_single_lookups(eastbound):
+    times = [0.0, 30.0, 59.0, 300.0, 540.0, 45.0]
+    assert eastbound.positions_at(times) == [eastbound.position_at(t) for t in times]
+
+
+def test_datetime_timestamps():
+    t0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    track = Trajectory([(t0, encode_uvoxid(EARTH_RADIUS_UM, 0, 0))])
+    assert track.position_at(t0) == encode_uvoxid(EARTH_RADIUS_UM, 0, 0)
+
+
+def test_downsample_and_window(eastbound):
+    coarse = eastbound.downsample(180.0)
+    assert [t for t, _ in coarse] == [0.0, 180.0, 360.0, 540.0]
+    assert len(eastbound.window(60.0, 180.0)) == 3
+
+
+def test_store_batch_queries(eastbound):
+    store = TrajectoryStore()
+    for t, uv in eastbound:
+        store.append("a", t, uv)
+    store.append("b", 1000.0, encode_uvoxid(EARTH_RADIUS_UM, 0, 0))
+    positions = store.positions_at(90.0)
+    assert set(positions) == {"a"}
+    assert positions["a"] == eastbound.position_at(90.0)